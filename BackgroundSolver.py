@@ -0,0 +1,162 @@
+"""Runs the solver in a worker thread and streams its moves while it is still searching
+
+The worker writes every move into a bounded queue in small chunks, so the GUI can show the first moves right away and
+memory stays bounded when the search is faster than the replay (the worker waits for the GUI to catch up).
+The search can be cancelled at any moment: the next move the worker writes raises Cancelled, which unwinds the
+recursion and ends the thread.
+
+The file contains the following classes:
+    :class Cancelled: raised inside the worker when the search was cancelled
+    :class MoveStream: a moves object for Solver.SudokuSolver that sends the moves into a queue
+    :class BackgroundSolver: starts, reads and cancels a solve in a worker thread
+"""
+
+import queue
+import threading
+import Solver
+
+# amount of moves sent to the queue together , and the amount of chunks the queue holds
+CHUNK_MOVES = 256
+QUEUE_CHUNKS = 64
+
+
+class Cancelled(Exception):
+    """raised inside the worker when the search was cancelled"""
+
+
+class MoveStream:
+    """A moves object for Solver.SudokuSolver that sends the moves into a queue
+
+    :atr self.queue: the queue of chunks of moves
+    :type self.queue: queue.Queue
+    :atr self.cancelled: set when the search should stop
+    :type self.cancelled: threading.Event
+    :atr self.chunk: the moves that were not sent yet
+    :type self.chunk: list (Solver.Cube)
+
+    :method __init__: Initiates the class
+    :method record: adds a move and sends the chunk when it is full
+    :method flush: sends the moves that were not sent yet
+    :method reverse: does nothing , the moves were already sent in order
+
+    :param moves_queue: the queue of chunks of moves
+    :type moves_queue: queue.Queue
+    :param cancelled: set when the search should stop
+    :type cancelled: threading.Event
+    """
+    def __init__(self, moves_queue, cancelled):
+        """Initiates the class"""
+        self.queue = moves_queue
+        self.cancelled = cancelled
+        self.chunk = []
+
+    def record(self, row, col, num, placed):
+        """adds a move and sends the chunk when it is full
+
+        :param row: row index
+        :type row: int
+        :param col: column index
+        :type col: int
+        :param num: the number
+        :type num: int
+        :param placed: true if the number was put , false if it was removed
+        :type placed: bool
+        """
+        if self.cancelled.is_set():
+            raise Cancelled()
+        self.chunk.append(Solver.Cube(row, col, num, placed))
+        if len(self.chunk) >= CHUNK_MOVES:
+            self.flush()
+
+    def flush(self):
+        """sends the moves that were not sent yet (waits while the queue is full , unless cancelled)"""
+        while self.chunk:
+            try:
+                self.queue.put(self.chunk, timeout=0.1)
+                self.chunk = []
+            except queue.Full:
+                if self.cancelled.is_set():
+                    raise Cancelled()
+
+    def reverse(self):
+        """does nothing , the moves were already sent in order"""
+
+
+class BackgroundSolver:
+    """A class that starts, reads and cancels a solve in a worker thread
+
+    :atr self.board: the copy of the board that the worker solves
+    :type self.board: list (int*int)
+    :atr self.queue: the chunks of moves sent by the worker
+    :type self.queue: queue.Queue
+    :atr self.cancelled: set when the search should stop
+    :type self.cancelled: threading.Event
+    :atr self.thread: the worker
+    :type self.thread: threading.Thread
+    :atr self.result: true if solved , false if not , None while still running (or cancelled)
+    :type self.result: bool
+    :atr self.pending: moves taken from the queue and not returned yet
+    :type self.pending: list (Solver.Cube)
+    :atr self.stats: the counters of the worker search (they run ahead of the moves taken)
+    :type self.stats: Solver.SolverStats
+
+    :method __init__: Initiates the class and starts the worker
+    :method run: the body of the worker
+    :method take: returns up to 'amount' of the next moves without waiting
+    :method done: true when the worker ended and all its moves were taken
+    :method cancel: stops the worker and waits for it to end
+
+    :param board: the sudoku to solve (isn't changed , the worker solves a copy)
+    :type board: list (int*int)
+    :param backend: the name of the solving algorithm (see Solver.SudokuSolver)
+    :type backend: str
+    """
+    def __init__(self, board, backend="bitmask"):
+        """Initiates the class and starts the worker"""
+        self.board = Solver.CopyBoard(board)
+        self.queue = queue.Queue(QUEUE_CHUNKS)
+        self.cancelled = threading.Event()
+        self.result = None
+        self.pending = []
+        self.stats = Solver.SolverStats()
+        self.thread = threading.Thread(target=self.run, args=(backend,), daemon=True)
+        self.thread.start()
+
+    def run(self, backend):
+        """the body of the worker : solves the copy and sends the last moves
+
+        :param backend: the name of the solving algorithm
+        :type backend: str
+        """
+        stream = MoveStream(self.queue, self.cancelled)
+        try:
+            solved = Solver.SudokuSolver(self.board, stream, backend, stats=self.stats)
+            stream.flush()
+            self.result = solved
+        except Cancelled:
+            pass
+
+    def take(self, amount):
+        """returns up to 'amount' of the next moves without waiting
+
+        :param amount: the biggest amount of moves to return
+        :type amount: int
+        :return: the moves in the order they were made
+        :rtype: list (Solver.Cube)
+        """
+        while len(self.pending) < amount:
+            try:
+                self.pending.extend(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        moves, self.pending = self.pending[:amount], self.pending[amount:]
+        return moves
+
+    def done(self):
+        """true when the worker ended and all its moves were taken"""
+        return not self.thread.is_alive() and self.queue.empty() and not self.pending
+
+    def cancel(self):
+        """stops the worker and waits for it to end"""
+        self.cancelled.set()
+        self.thread.join()
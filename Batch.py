@@ -0,0 +1,143 @@
+"""Solves large amounts of sudokus over a pool of processes
+
+The puzzles travel between the processes as one line strings (81 characters for 9x9 , see Solver.LineToBoard), which
+are much cheaper to pickle than nested lists, and are solved as flat Board.Board buffers.
+The input is read in chunks and only a bounded amount of chunks is sent to the workers at the same time, so an
+iterable with millions of puzzles is never held in memory at once.
+
+The file contains the following functions and classes:
+    :class Result: the outcome of a single puzzle of the batch
+    :func SolveLines: solves a chunk of puzzle lines (runs inside the workers)
+    :func SolveBatch: a generator that solves an iterable of puzzles and yields their results
+"""
+
+import itertools
+import time
+from collections import namedtuple, deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import os
+import Board
+import Solver
+
+# index is the position of the puzzle in the input , solution is None if the puzzle has no solution , error holds the
+# message of a puzzle that could not be read or solved (or ran out of budget) and stats the counters of the solve
+# (Solver.SolverStats.as_dict) when they were asked for
+Result = namedtuple('Result', ['index', 'puzzle', 'solution', 'error', 'stats'], defaults=(None,))
+
+# amount of nodes between the checks of the budget
+BUDGET_EVERY = 256
+
+
+def SolveLines(lines, backend="bitmask", stats=False, nodes=None, seconds=None):
+    """solves a chunk of puzzle lines (runs inside the workers)
+
+    A puzzle that raises an error doesn't stop the rest of the chunk, its error message is returned instead.
+    With a budget (nodes and/or seconds for every puzzle) the search of a puzzle is stopped through the
+    Solver.SolverStats callback once it ran out, and the puzzle gets an error.
+
+    :param lines: puzzle lines
+    :type lines: list (str)
+    :param backend: the name of the solving algorithm (see Solver.SudokuSolver)
+    :type backend: str
+    :param stats: return the counters of every solve (default is False)
+    :type stats: bool
+    :param nodes: the most numbers the search of a puzzle puts , checked every BUDGET_EVERY nodes (default is None)
+    :type nodes: int
+    :param seconds: the most time the search of a puzzle takes , checked every BUDGET_EVERY nodes (default is None)
+    :type seconds: float
+    :return: (solution line or None, error message or None, stats dict or None) for every puzzle
+    :rtype: list ([(str,str,dict),...])
+    """
+    results = []
+    for line in lines:
+        counters = None
+        try:
+            sudoku = Board.Board.from_line(line)
+            if stats or nodes is not None or seconds is not None:
+                deadline = None if seconds is None else time.perf_counter() + seconds
+
+                def over_budget(counted):
+                    """true when the puzzle ran out of nodes or time"""
+                    return (nodes is not None and counted.nodes >= nodes) or \
+                        (deadline is not None and time.perf_counter() >= deadline)
+
+                counters = Solver.SolverStats(over_budget, BUDGET_EVERY)
+            solved = Solver.SudokuSolver(sudoku, backend=backend, stats=counters)
+            if solved:
+                results.append((sudoku.to_line(), None, counters))
+            elif counters is not None and counters.cancelled:
+                results.append((None, "the budget ran out after %d nodes" % counters.nodes, counters))
+            else:
+                results.append((None, None, counters))
+        except Exception as error:
+            results.append((None, "%s: %s" % (type(error).__name__, error), counters))
+    return [(solution, error, counters.as_dict() if stats and counters is not None else None)
+            for solution, error, counters in results]
+
+
+def SolveBatch(puzzles, processes=None, chunksize=64, ordered=True, backend="bitmask", stats=False, nodes=None,
+               seconds=None):
+    """a generator that solves an iterable of puzzles and yields their results
+
+    The puzzles are split into chunks of 'chunksize' and at most two chunks for each process are waiting at any
+    time.
+    With ordered the results come in the same order as the puzzles, otherwise each chunk is yielded as soon as it is
+    done.
+
+    :param puzzles: boards (list (int*int) or Board.Board) or puzzle lines
+    :type puzzles: iterable
+    :param processes: amount of worker processes , 1 solves in this process (default is the amount of cpus)
+    :type processes: int
+    :param chunksize: amount of puzzles sent to a worker at once (default is 64)
+    :type chunksize: int
+    :param ordered: keep the order of the input (default is True)
+    :type ordered: bool
+    :param backend: the name of the solving algorithm (see Solver.SudokuSolver)
+    :type backend: str
+    :param stats: give the counters of every solve in the results (default is False)
+    :type stats: bool
+    :param nodes: the most numbers the search of a puzzle puts (default is None , no limit)
+    :type nodes: int
+    :param seconds: the most time the search of a puzzle takes (default is None , no limit)
+    :type seconds: float
+    :return: generator of Result
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    lines = (puzzle if isinstance(puzzle, str) else Solver.BoardToLine(puzzle) for puzzle in puzzles)
+    chunks = iter(lambda: list(itertools.islice(lines, chunksize)), [])
+    index = 0
+
+    def results(start, chunk, solved):
+        """turns the solved lines of a chunk into Result"""
+        return [Result(start + i, line, solution, error, counters) for i, (line, (solution, error, counters)) in
+                enumerate(zip(chunk, solved))]
+
+    if processes == 1:
+        for chunk in chunks:
+            yield from results(index, chunk, SolveLines(chunk, backend, stats, nodes, seconds))
+            index += len(chunk)
+        return
+
+    with ProcessPoolExecutor(processes) as pool:
+        pending = deque()
+
+        def finished():
+            """takes the next finished chunk out of pending (the oldest one when ordered)"""
+            if not ordered:
+                done, _ = wait([item[2] for item in pending], return_when=FIRST_COMPLETED)
+                for item in pending:
+                    if item[2] in done:
+                        pending.remove(item)
+                        return item
+            return pending.popleft()
+
+        for chunk in chunks:
+            pending.append((index, chunk, pool.submit(SolveLines, chunk, backend, stats, nodes, seconds)))
+            index += len(chunk)
+            if len(pending) >= 2 * processes:
+                start, chunk_done, future = finished()
+                yield from results(start, chunk_done, future.result())
+        while pending:
+            start, chunk_done, future = finished()
+            yield from results(start, chunk_done, future.result())
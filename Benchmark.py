@@ -0,0 +1,226 @@
+"""Measures the solver on the puzzle corpora and compares the results with a saved baseline
+
+The corpora are text files in the corpora folder , one puzzle line a line (see Solver.LineToBoard) and '#' for
+comments: easy, hard, minimal17 (17 clue puzzles) and adversarial (puzzles built against naive backtracking).
+For every puzzle it writes the wall time (the best of a few runs), the search nodes (numbers put), the backtracks
+(numbers taken back) and the peak memory of the solve. The results are written as JSON , and when a baseline is
+given every corpus is compared with it and the run fails when the time or the nodes grew past the threshold.
+
+Usage:
+    python Benchmark.py --backend dlx --output results.json --baseline baseline.json --threshold 0.25
+
+The file contains the following functions and classes:
+    :class MoveCounter: a moves object for Solver.SudokuSolver that only counts the moves
+    :func ReadCorpus: reads the puzzles of a corpus file
+    :func MeasurePuzzle: measures a single puzzle
+    :func Run: measures all the corpora
+    :func Compare: compares results with a baseline
+    :func main: the command line entry point
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import Solver
+
+CORPORA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpora")
+CORPORA = ("easy", "hard", "minimal17", "adversarial")
+
+
+class MoveCounter:
+    """A moves object for Solver.SudokuSolver that only counts the moves
+
+    :atr self.nodes: amount of numbers put
+    :type self.nodes: int
+    :atr self.backtracks: amount of numbers taken back
+    :type self.backtracks: int
+
+    :method __init__: Initiates the class
+    :method record: counts a move
+    :method reverse: does nothing , there are no moves to reverse
+    """
+    def __init__(self):
+        """Initiates the class"""
+        self.nodes = 0
+        self.backtracks = 0
+
+    def record(self, row, col, num, placed):
+        """counts a move
+
+        :param row: row index
+        :type row: int
+        :param col: column index
+        :type col: int
+        :param num: the number
+        :type num: int
+        :param placed: true if the number was put , false if it was removed
+        :type placed: bool
+        """
+        if placed:
+            self.nodes += 1
+        else:
+            self.backtracks += 1
+
+    def reverse(self):
+        """does nothing , there are no moves to reverse"""
+
+
+def ReadCorpus(name, directory=CORPORA_DIR):
+    """reads the puzzles of a corpus file
+
+    :param name: the corpus name (the file name without .txt)
+    :type name: str
+    :param directory: the folder of the corpora (default is the corpora folder next to this file)
+    :type directory: str
+    :return: the puzzle lines
+    :rtype: list (str)
+    """
+    with open(os.path.join(directory, name + ".txt")) as corpus:
+        return [line.strip() for line in corpus if line.strip() and not line.startswith("#")]
+
+
+def MeasurePuzzle(line, backend="bitmask", repeat=3, stages=None):
+    """measures a single puzzle
+
+    The time is the best of 'repeat' solves, the nodes and backtracks are counted in a separate solve and the memory
+    in another one (counting and tracing memory slow the solver down).
+
+    :param line: the puzzle line
+    :type line: str
+    :param backend: the name of the solving algorithm (see Solver.SudokuSolver)
+    :type backend: str
+    :param repeat: amount of timed solves (default is 3)
+    :type repeat: int
+    :param stages: names of Propagation.STAGES to run before the search (default is None)
+    :type stages: list (str)
+    :return: the measures of the puzzle
+    :rtype: dict
+    """
+    best = None
+    for _ in range(repeat):
+        sudoku = Solver.LineToBoard(line)
+        start = time.perf_counter()
+        solved = Solver.SudokuSolver(sudoku, backend=backend, stages=stages)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    counter = MoveCounter()
+    Solver.SudokuSolver(Solver.LineToBoard(line), counter, backend, stages)
+    sudoku = Solver.LineToBoard(line)
+    tracemalloc.start()
+    Solver.SudokuSolver(sudoku, backend=backend, stages=stages)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"puzzle": line, "solved": solved, "seconds": best, "nodes": counter.nodes,
+            "backtracks": counter.backtracks, "peak_bytes": peak}
+
+
+def Run(corpora=CORPORA, backend="bitmask", repeat=3, stages=None, directory=CORPORA_DIR):
+    """measures all the corpora
+
+    :param corpora: names of the corpora (default is all of them)
+    :type corpora: iterable
+    :param backend: the name of the solving algorithm (see Solver.SudokuSolver)
+    :type backend: str
+    :param repeat: amount of timed solves of every puzzle (default is 3)
+    :type repeat: int
+    :param stages: names of Propagation.STAGES to run before the search (default is None)
+    :type stages: list (str)
+    :param directory: the folder of the corpora (default is the corpora folder next to this file)
+    :type directory: str
+    :return: the results , ready to be written as JSON
+    :rtype: dict
+    """
+    results = {"backend": backend, "stages": stages, "python": platform.python_version(), "corpora": {}}
+    for name in corpora:
+        puzzles = [MeasurePuzzle(line, backend, repeat, stages) for line in ReadCorpus(name, directory)]
+        results["corpora"][name] = {
+            "puzzles": puzzles,
+            "seconds": sum(puzzle["seconds"] for puzzle in puzzles),
+            "nodes": sum(puzzle["nodes"] for puzzle in puzzles),
+            "backtracks": sum(puzzle["backtracks"] for puzzle in puzzles),
+            "peak_bytes": max((puzzle["peak_bytes"] for puzzle in puzzles), default=0),
+        }
+    return results
+
+
+def Compare(results, baseline, threshold=0.25):
+    """compares results with a baseline
+
+    A corpus regressed when its total time or nodes grew by more than 'threshold' (0.25 is 25%) or a puzzle that
+    was solved is not solved anymore. Results of another backend or other stages can't be compared with the baseline.
+
+    :param results: the new results (see Run)
+    :type results: dict
+    :param baseline: the saved results
+    :type baseline: dict
+    :param threshold: the allowed growth (default is 0.25)
+    :type threshold: float
+    :return: a message for every regression (empty when there are none)
+    :rtype: list (str)
+    """
+    for key, default in (("backend", "bitmask"), ("stages", None)):
+        if (results.get(key, default) or None) != (baseline.get(key, default) or None):
+            raise ValueError("the baseline was measured with %s %r , the results with %r" % (
+                key, baseline.get(key, default), results.get(key, default)))
+    regressions = []
+    for name, corpus in results["corpora"].items():
+        base = baseline.get("corpora", {}).get(name)
+        if base is None:
+            continue
+        for key in ("seconds", "nodes"):
+            if base[key] and corpus[key] > base[key] * (1 + threshold):
+                regressions.append("%s: %s grew from %s to %s (+%.0f%%)" % (
+                    name, key, base[key], corpus[key], 100 * (corpus[key] / base[key] - 1)))
+        solved = {puzzle["puzzle"] for puzzle in corpus["puzzles"] if puzzle["solved"]}
+        for puzzle in base["puzzles"]:
+            if puzzle["solved"] and puzzle["puzzle"] not in solved:
+                regressions.append("%s: %s is not solved anymore" % (name, puzzle["puzzle"]))
+    return regressions
+
+
+def main(argv=None):
+    """the command line entry point
+
+    :param argv: the arguments (default is sys.argv[1:])
+    :type argv: list (str)
+    :return: the exit code , 1 when a regression was found
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description="Measure the sudoku solver on the puzzle corpora")
+    parser.add_argument("--backend", default="bitmask", choices=("bitmask", "dlx"))
+    parser.add_argument("--stages", nargs="*", default=None, help="propagation stages to run before the search")
+    parser.add_argument("--corpora", nargs="*", default=list(CORPORA))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with the results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    results = Run(args.corpora, args.backend, args.repeat, args.stages)
+    for name, corpus in results["corpora"].items():
+        print("%-12s %3d puzzles %10.4f s %10d nodes %10d backtracks %10d peak bytes" % (
+            name, len(corpus["puzzles"]), corpus["seconds"], corpus["nodes"], corpus["backtracks"],
+            corpus["peak_bytes"]))
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            try:
+                regressions = Compare(results, json.load(baseline), args.threshold)
+            except ValueError as error:
+                print("MISMATCH %s" % error)
+                return 1
+        for regression in regressions:
+            print("REGRESSION " + regression)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""A compact sudoku board , one byte for every cube in a single flat buffer
+
+A Board keeps the cubes row after row in a bytearray (or any writable byte buffer , like a NumPy uint8 array) instead
+of a list of lists. It still looks like a list of rows to the solver and the GUI: len(board) is n and board[row] is a
+memoryview of that row, so board[row][col] reads and writes the buffer without copying anything.
+Copying is a single slice of the buffer, the key of a board is a bytes copy of it, and the one line format and NumPy
+convert through the buffer in C (a translate table for the line , a view for NumPy).
+
+The file contains the following classes:
+    :class Board: the flat board and its conversions
+"""
+
+import math
+import Solver
+
+# a value for every character of a puzzle line (255 for the characters that aren't numbers) and back
+_TO_VALUES = bytearray([255]) * 256
+_TO_VALUES[ord('.')] = 0
+for _value, _char in enumerate(Solver.SYMBOLS):
+    _TO_VALUES[ord(_char)] = _TO_VALUES[ord(_char.lower())] = _value
+_TO_VALUES = bytes(_TO_VALUES)
+_TO_CHARS = bytes(Solver.SYMBOLS.encode("ascii").ljust(256, b"?"))
+
+
+class Board:
+    """A class that holds a board as one flat buffer and shows it as rows
+
+    :atr self.cells: the cubes row after row (0 in the empty places)
+    :type self.cells: memoryview (format 'B')
+    :atr self.n: amount of cubes each side
+    :type self.n: int
+    :atr self.rows: a view of every row of the buffer (made on the first access , so a copy that is only hashed or
+     written as a line never makes them)
+    :type self.rows: list (memoryview)
+
+    :method __init__: Initiates the class
+    :method from_line: makes a board from a puzzle line
+    :method from_rows: makes a board from a list of lists
+    :method from_array: makes a board that shares the buffer of a NumPy uint8 array
+    :method to_line: writes the board as one line of characters
+    :method to_rows: returns the board as a list of lists
+    :method to_array: returns a NumPy (n, n) uint8 view of the board
+    :method copy: returns a new board with a copy of the buffer
+    :method key: returns the cubes as bytes (a hashable key)
+
+    :param cells: the cubes row after row , a writable buffer is shared and bytes are copied
+    :type cells: bytearray , bytes , array or any byte buffer
+    :param n: amount of cubes each side (default is None , taken from the length of cells)
+    :type n: int
+    """
+    __slots__ = ("cells", "n", "rows")
+
+    def __init__(self, cells, n=None):
+        """Initiates the class"""
+        if isinstance(cells, bytes):
+            cells = bytearray(cells)
+        self.cells = memoryview(cells).cast('B')
+        if n is None:
+            n = math.isqrt(len(self.cells))
+        if n * n != len(self.cells):
+            raise ValueError("a board of %d cubes each side needs %d cubes , got %d" % (n, n * n, len(self.cells)))
+        Solver.BoxSize(n)
+        self.n = n
+        self.rows = None
+
+    @classmethod
+    def from_line(cls, line):
+        """makes a board from a puzzle line (see Solver.LineToBoard for the format)
+
+        :param line: the puzzle line
+        :type line: str
+        :rtype: Board
+        """
+        cells = bytearray(line.strip().encode("ascii", "replace").translate(_TO_VALUES))
+        board = cls(cells)
+        if cells and max(cells) > board.n:
+            raise ValueError("a puzzle line of size %d has a number above %d" % (board.n, board.n))
+        return board
+
+    @classmethod
+    def from_rows(cls, sudoku):
+        """makes a board from a list of lists
+
+        :param sudoku: sudoku board
+        :type sudoku: list (int*int)
+        :rtype: Board
+        """
+        return cls(bytearray(num for row in sudoku for num in row), len(sudoku))
+
+    @classmethod
+    def from_array(cls, array):
+        """makes a board that shares the buffer of a NumPy uint8 array (changes show in both)
+
+        :param array: a C contiguous uint8 array of shape (n, n) or (n*n,)
+        :type array: numpy.ndarray
+        :rtype: Board
+        """
+        return cls(array)
+
+    def to_line(self):
+        """writes the board as one line of characters ('0' in the empty places)
+
+        :rtype: str
+        """
+        return self.cells.tobytes().translate(_TO_CHARS).decode("ascii")
+
+    def to_rows(self):
+        """returns the board as a list of lists
+
+        :rtype: list (int*int)
+        """
+        return [row.tolist() for row in self]
+
+    def to_array(self):
+        """returns a NumPy (n, n) uint8 view of the board (changes show in both)
+
+        :rtype: numpy.ndarray
+        """
+        import numpy as np
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.n, self.n)
+
+    def copy(self):
+        """returns a new board with a copy of the buffer
+
+        :rtype: Board
+        """
+        board = Board.__new__(Board)
+        board.cells = memoryview(bytearray(self.cells))
+        board.n = self.n
+        board.rows = None
+        return board
+
+    def key(self):
+        """returns the cubes as bytes (a hashable key)
+
+        :rtype: bytes
+        """
+        return self.cells.tobytes()
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, row):
+        if self.rows is None:
+            n = self.n
+            self.rows = [self.cells[start:start + n] for start in range(0, n * n, n)]
+        return self.rows[row]
+
+    def __iter__(self):
+        return (self[row] for row in range(self.n))
+
+    def __eq__(self, other):
+        if isinstance(other, Board):
+            return self.cells == other.cells
+        if isinstance(other, list):
+            return self.to_rows() == other
+        return NotImplemented
+
+    def __hash__(self):
+        # the board can be changed , don't change it while it is a key
+        return hash(self.cells.tobytes())
+
+    def __reduce__(self):
+        return Board, (self.cells.tobytes(), self.n)
+
+    def __repr__(self):
+        return "Board(%r)" % self.to_line()
+
@@ -0,0 +1,157 @@
+"""A solution cache that survives restarts , keyed by the canonical form of the puzzles (see Canonical.py)
+
+A puzzle and all its disguises (relabeled numbers , swapped rows , bands , transposed ...) share one entry: the
+solution of the canonical board. A hit maps that solution back through the inverse of the transform of the asked
+board , so the solver isn't called at all.
+The entries are kept in a bounded LRU in memory and in an sqlite file , a miss in memory looks in the file before
+the puzzle is solved.
+
+The file contains the following classes:
+    :class SolutionCache: the memory and disk cache of canonical solutions
+"""
+
+import sqlite3
+from collections import OrderedDict
+import Canonical
+import Oracle
+import Solver
+
+
+class SolutionCache:
+    """A class that keeps the solutions of canonical puzzles in memory and on disk
+
+    An entry is the flat solution of the canonical board , or b"" when the puzzle has no solution.
+
+    :atr self.maxsize: the biggest amount of entries kept in memory
+    :type self.maxsize: int
+    :atr self.memory: the entries used lately
+    :type self.memory: OrderedDict (bytes: bytes)
+    :atr self.db: the sqlite connection (None when there is no file)
+    :type self.db: sqlite3.Connection
+    :atr self.hits: amount of puzzles found in memory or on disk
+    :type self.hits: int
+    :atr self.misses: amount of puzzles that had to be solved
+    :type self.misses: int
+
+    :method __init__: Initiates the class and opens the file
+    :method remember: puts an entry in memory and drops the least recently used ones above maxsize
+    :method lookup: returns the entry of a canonical board from memory or the file
+    :method get: returns the solution of a board if it is known
+    :method put: stores the solution of a board
+    :method solve: solves a board in place , from the cache when it is known
+    :method close: closes the file
+
+    :param path: the sqlite file , created if it doesn't exist (default is None , memory only)
+    :type path: str
+    :param maxsize: the biggest amount of entries kept in memory (default is 1024)
+    :type maxsize: int
+    """
+    def __init__(self, path=None, maxsize=1024):
+        """Initiates the class and opens the file"""
+        self.maxsize = maxsize
+        self.memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(path)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("CREATE TABLE IF NOT EXISTS solutions (puzzle BLOB PRIMARY KEY, solution BLOB NOT NULL)")
+            self.db.commit()
+
+    def remember(self, form, entry):
+        """puts an entry in memory and drops the least recently used ones above maxsize
+
+        :param form: the canonical board
+        :type form: bytes
+        :param entry: its solution (b"" for none)
+        :type entry: bytes
+        """
+        self.memory[form] = entry
+        self.memory.move_to_end(form)
+        while len(self.memory) > self.maxsize:
+            self.memory.popitem(last=False)
+
+    def lookup(self, form):
+        """returns the entry of a canonical board from memory or the file (None when it is not known)
+
+        :param form: the canonical board
+        :type form: bytes
+        :rtype: bytes
+        """
+        entry = self.memory.get(form)
+        if entry is not None:
+            self.memory.move_to_end(form)
+            return entry
+        if self.db is not None:
+            row = self.db.execute("SELECT solution FROM solutions WHERE puzzle = ?", (form,)).fetchone()
+            if row is not None:
+                entry = bytes(row[0])
+                self.remember(form, entry)
+        return entry
+
+    def get(self, sudoku, canonical=None):
+        """returns the solution of a board if it is known
+
+        :param sudoku: sudoku board (isn't changed)
+        :type sudoku: list (int*int) or Board.Board
+        :param canonical: the canonical form and transform of the board if they are already known (default is None)
+        :type canonical: tuple (bytes, Canonical.Transform)
+        :return: the flat solution of the board , b"" when it has no solution or None when it is not known
+        :rtype: bytes
+        """
+        form, transform = canonical or Canonical.Canonicalize(sudoku)
+        entry = self.lookup(form)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return Canonical.Restore(entry, len(sudoku), transform) if entry else entry
+
+    def put(self, sudoku, solution, canonical=None):
+        """stores the solution of a board
+
+        :param sudoku: sudoku board (the puzzle , isn't changed)
+        :type sudoku: list (int*int) or Board.Board
+        :param solution: its solution (None when it has no solution)
+        :type solution: list (int*int) or Board.Board
+        :param canonical: the canonical form and transform of the board if they are already known (default is None)
+        :type canonical: tuple (bytes, Canonical.Transform)
+        """
+        form, transform = canonical or Canonical.Canonicalize(sudoku)
+        entry = b"" if solution is None else Canonical.Apply(Oracle.BoardKey(solution), len(sudoku), transform)
+        self.remember(form, entry)
+        if self.db is not None:
+            self.db.execute("INSERT OR REPLACE INTO solutions (puzzle, solution) VALUES (?, ?)", (form, entry))
+            self.db.commit()
+
+    def solve(self, sudoku, backend="bitmask", stages=None):
+        """solves a board in place , from the cache when it is known (the solver runs only on a miss)
+
+        :param sudoku: a given matrix with numbers (0 in the empty places)
+        :type sudoku: list (int*int) or Board.Board
+        :param backend: the name of the solving algorithm (see Solver.SudokuSolver)
+        :type backend: str
+        :param stages: names of Propagation.STAGES to run before the search (default is None)
+        :type stages: iterable
+        :return: true if Sudoku was solved , false if not
+        """
+        n = len(sudoku)
+        canonical = Canonical.Canonicalize(sudoku)
+        solution = self.get(sudoku, canonical)
+        if solution is None:
+            puzzle = Solver.CopyBoard(sudoku)
+            solved = Solver.SudokuSolver(sudoku, backend=backend, stages=stages)
+            self.put(puzzle, sudoku if solved else None, canonical)
+            return solved
+        if not solution:
+            return False
+        for row in range(n):
+            sudoku[row][:] = solution[row * n:(row + 1) * n]
+        return True
+
+    def close(self):
+        """closes the file"""
+        if self.db is not None:
+            self.db.close()
+            self.db = None
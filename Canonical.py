@@ -0,0 +1,185 @@
+"""Maps a sudoku to a canonical form , the same for all the boards that are the same puzzle in disguise
+
+Two boards are the same puzzle when one is the other after relabeling the numbers , reordering the rows inside a band
+(and the columns inside a stack) , reordering the bands (and the stacks) and transposing. The canonical form is the
+smallest board (read row after row , empty cubes first) among all of them , with the numbers relabeled 1, 2, 3... in
+the order they are first met.
+
+It is found in two steps: first the smallest pattern of empty/filled cubes (numbers don't matter) over all the column
+arrangements , where for every column arrangement the rows are simply sorted (bands by their sorted rows) , and then
+the smallest relabeled board among the arrangements that tie on that pattern.
+A symmetric puzzle can tie on a huge amount of arrangements , only MAX_TIES of them are compared then, so the form is
+still a legal transform of the board (solutions mapped back through it are right) but two disguises of that puzzle
+may get different forms. Boards with boxes bigger than MAX_BOX only get their numbers relabeled.
+
+The file contains the following functions and classes:
+    :class Transform: the transposition , the row and column orders and the relabeling of a board
+    :func Canonicalize: returns the canonical form of a board and the transform that makes it
+    :func Apply: transforms a flat board
+    :func Restore: transforms a flat board back (the inverse of Apply)
+"""
+
+import itertools
+from collections import namedtuple
+import Oracle
+import Solver
+
+# the most arrangements that tie on the pattern which are compared
+MAX_TIES = 4096
+# the biggest box that is canonicalized by rows and columns (the column arrangements grow as size!^(size+1))
+MAX_BOX = 3
+
+# cube (i,j) of the transformed board is cube (rows[i],cols[j]) of the board (of the transposed board if transpose)
+# and its number is labels[number]
+Transform = namedtuple('Transform', ['transpose', 'rows', 'cols', 'labels'])
+
+
+def Canonicalize(sudoku):
+    """returns the canonical form of a board and the transform that makes it
+
+    :param sudoku: sudoku board (isn't changed)
+    :type sudoku: list (int*int) or Board.Board
+    :return: the canonical board (flat , one byte for every cube) and the transform from the board to it
+    :rtype: tuple (bytes, Transform)
+    """
+    n = len(sudoku)
+    size = Solver.BoxSize(n)
+    cells = Oracle.BoardKey(sudoku)
+    if size > MAX_BOX:
+        arrangements = [(False, tuple(range(n)), tuple(range(n)))]
+    else:
+        arrangements = _PatternTies(cells, n, size)
+    best, best_transform = None, None
+    for transpose, rows, cols in arrangements:
+        labels = [0] * (n + 1)
+        used = 0
+        form = bytearray(n * n)
+        index = 0
+        for row in rows:
+            for col in cols:
+                num = cells[col * n + row] if transpose else cells[row * n + col]
+                if num and not labels[num]:
+                    used += 1
+                    labels[num] = used
+                form[index] = labels[num]
+                index += 1
+        if best is None or form < best:
+            # the numbers that are not on the board get the labels that are left , in order
+            for num in range(1, n + 1):
+                if not labels[num]:
+                    used += 1
+                    labels[num] = used
+            best, best_transform = form, Transform(transpose, rows, cols, tuple(labels))
+    return bytes(best), best_transform
+
+
+def _PatternTies(cells, n, size):
+    """returns the arrangements (transpose, rows, cols) that give the smallest pattern of empty/filled cubes
+
+    :param cells: the flat board
+    :type cells: bytes
+    :param n: amount of cubes each side
+    :type n: int
+    :param size: amount of cubes each side of a box
+    :type size: int
+    :rtype: list (tuple (bool, tuple, tuple))
+    """
+    perms = list(itertools.permutations(range(size)))
+    best, ties = None, []
+
+    def arrange(transpose, segments, stacks, depth, values, cols):
+        """adds the stacks one after another , the patterns of the rows so far are shared by the deeper stacks"""
+        if depth < size:
+            stack = stacks[depth]
+            for index, perm in enumerate(perms):
+                arrange(transpose, segments, stacks, depth + 1,
+                        [value << size | segment[stack][index] for value, segment in zip(values, segments)],
+                        cols + tuple(stack * size + col for col in perm))
+            return
+        nonlocal best, ties
+        # the first row of the sorted board is the smallest row , most arrangements stop here
+        if best is not None and min(values) > best[0][0]:
+            return
+        bands = sorted(tuple(sorted(values[band * size:(band + 1) * size])) for band in range(size))
+        if best is None or bands < best:
+            best, ties = bands, []
+        elif bands != best:
+            return
+        if len(ties) < MAX_TIES:
+            ties.extend((transpose, rows, cols) for rows in _RowOrders(values, size, MAX_TIES - len(ties)))
+
+    for transpose in (False, True):
+        filled = [[1 if (cells[col * n + row] if transpose else cells[row * n + col]) else 0 for col in range(n)]
+                  for row in range(n)]
+        # the pattern bits of every row inside every stack , for every order of the columns of the stack
+        segments = [[[sum(filled[row][stack * size + col] << (size - 1 - place) for place, col in enumerate(perm))
+                      for perm in perms] for stack in range(size)] for row in range(n)]
+        for stacks in perms:
+            arrange(transpose, segments, stacks, 0, [0] * n, ())
+    return ties
+
+
+def _RowOrders(values, size, limit):
+    """returns the orders of the rows that sort them (bands by their sorted rows , rows inside every band)
+
+    :param values: the pattern of every row
+    :type values: list (int)
+    :param size: amount of rows in a band
+    :type size: int
+    :param limit: the most orders returned
+    :type limit: int
+    :rtype: list (tuple (int))
+    """
+    perms = list(itertools.permutations(range(size)))
+    keys = [sorted(values[band * size:(band + 1) * size]) for band in range(size)]
+    band_orders = [order for order in perms if all(keys[a] <= keys[b] for a, b in zip(order, order[1:]))]
+    orders = []
+    for bands in band_orders:
+        inside = [[tuple(band * size + row for row in perm) for perm in perms
+                   if all(values[band * size + a] <= values[band * size + b] for a, b in zip(perm, perm[1:]))]
+                  for band in bands]
+        for rows in itertools.product(*inside):
+            orders.append(sum(rows, ()))
+            if len(orders) >= limit:
+                return orders
+    return orders
+
+
+def Apply(cells, n, transform):
+    """transforms a flat board
+
+    :param cells: the flat board (one byte for every cube)
+    :type cells: bytes
+    :param n: amount of cubes each side
+    :type n: int
+    :param transform: the transform
+    :type transform: Transform
+    :rtype: bytes
+    """
+    labels = transform.labels
+    if transform.transpose:
+        return bytes(labels[cells[col * n + row]] for row in transform.rows for col in transform.cols)
+    return bytes(labels[cells[row * n + col]] for row in transform.rows for col in transform.cols)
+
+
+def Restore(cells, n, transform):
+    """transforms a flat board back (the inverse of Apply)
+
+    :param cells: the flat transformed board (one byte for every cube)
+    :type cells: bytes
+    :param n: amount of cubes each side
+    :type n: int
+    :param transform: the transform that made it
+    :type transform: Transform
+    :rtype: bytes
+    """
+    inverse = [0] * (n + 1)
+    for num, label in enumerate(transform.labels):
+        inverse[label] = num
+    board = bytearray(n * n)
+    index = 0
+    for row in transform.rows:
+        for col in transform.cols:
+            board[col * n + row if transform.transpose else row * n + col] = inverse[cells[index]]
+            index += 1
+    return bytes(board)
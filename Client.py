@@ -0,0 +1,178 @@
+"""A client of the local solving service (see Server.py) with a pool of connections
+
+Every connection carries one request at a time , so the amount of connections is the amount of requests a client has
+in flight. Idle connections are kept for the next requests , a closed one is replaced on the next request.
+
+Usage:
+    client = Client.SolverClient(port=8765)
+    solution = await client.solve("003020600900305001001806400008102900700000008006708200002609500800203009005010300")
+    await client.close()
+
+The file contains the following classes:
+    :class ServiceError: the server answered with an error or a timeout
+    :class SolverClient: the connection pool and the requests
+"""
+
+import asyncio
+import json
+import Solver
+
+
+class ServiceError(Exception):
+    """the server answered with an error or a timeout"""
+
+
+class SolverClient:
+    """A class that sends requests to the solving server over a pool of connections
+
+    :atr self.host: the server address
+    :type self.host: str
+    :atr self.port: the server TCP port (None when path is used)
+    :type self.port: int
+    :atr self.path: the server Unix socket (None when port is used)
+    :type self.path: str
+    :atr self.size: the most connections open at the same time
+    :type self.size: int
+    :atr self.timeout: seconds to wait for an answer (None for no limit)
+    :type self.timeout: float
+    :atr self.idle: the open connections that are free (reader , writer)
+    :type self.idle: list (tuple)
+    :atr self.open: amount of open connections
+    :type self.open: int
+    :atr self.free: the amount of connections that may still be taken
+    :type self.free: asyncio.Semaphore
+
+    :method __init__: Initiates the class
+    :method acquire: takes a free connection , opening one if needed
+    :method release: gives a connection back to the pool (or closes it if it is broken)
+    :method ask: sends one line and returns the answer line
+    :method solve: solves a puzzle
+    :method solve_many: solves puzzles at the same time over the pool
+    :method stats: returns the counters of the server
+    :method close: closes all the connections
+
+    :param host: the server address (default is "127.0.0.1")
+    :type host: str
+    :param port: the server TCP port (default is None)
+    :type port: int
+    :param path: the server Unix socket , used instead of the port (default is None)
+    :type path: str
+    :param size: the most connections open at the same time (default is 4)
+    :type size: int
+    :param timeout: seconds to wait for an answer (default is None , no limit)
+    :type timeout: float
+    """
+    def __init__(self, host="127.0.0.1", port=None, path=None, size=4, timeout=None):
+        """Initiates the class"""
+        if port is None and path is None:
+            raise ValueError("a port or a path of the server is needed")
+        self.host = host
+        self.port = port
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self.idle = []
+        self.open = 0
+        # made on the first request , inside the running loop
+        self.free = None
+
+    async def acquire(self):
+        """takes a free connection , opening one if needed (waits while all of them are taken)
+
+        :return: the reader and the writer of the connection
+        :rtype: tuple (asyncio.StreamReader, asyncio.StreamWriter)
+        """
+        if self.free is None:
+            self.free = asyncio.Semaphore(self.size)
+        await self.free.acquire()
+        if self.idle:
+            return self.idle.pop()
+        try:
+            if self.path is not None:
+                connection = await asyncio.open_unix_connection(self.path)
+            else:
+                connection = await asyncio.open_connection(self.host, self.port)
+        except BaseException:
+            self.free.release()
+            raise
+        self.open += 1
+        return connection
+
+    def release(self, connection, broken=False):
+        """gives a connection back to the pool (or closes it if it is broken)
+
+        :param connection: the reader and the writer of the connection
+        :type connection: tuple (asyncio.StreamReader, asyncio.StreamWriter)
+        :param broken: true if the connection can't be used anymore (default is False)
+        :type broken: bool
+        """
+        if broken:
+            connection[1].close()
+            self.open -= 1
+        else:
+            self.idle.append(connection)
+        self.free.release()
+
+    async def ask(self, line):
+        """sends one line and returns the answer line
+
+        :param line: the request
+        :type line: str
+        :return: the answer (without the newline)
+        :rtype: str
+        """
+        connection = await self.acquire()
+        reader, writer = connection
+        try:
+            writer.write(line.encode("ascii") + b"\n")
+            await writer.drain()
+            answer = await asyncio.wait_for(reader.readline(), self.timeout)
+            if not answer:
+                raise ConnectionError("the server closed the connection")
+        except BaseException:
+            # the answer may still come later , so the connection can't be reused
+            self.release(connection, broken=True)
+            raise
+        self.release(connection)
+        return answer.decode("ascii").strip()
+
+    async def solve(self, puzzle):
+        """solves a puzzle
+
+        :param puzzle: a puzzle line or a board
+        :type puzzle: str , list (int*int) or Board.Board
+        :return: the solution line , None if the puzzle has no solution
+        :rtype: str
+        """
+        line = puzzle if isinstance(puzzle, str) else Solver.BoardToLine(puzzle)
+        answer = await self.ask(line.strip())
+        if answer == "none":
+            return None
+        if answer == "timeout" or answer.startswith("error"):
+            raise ServiceError(answer)
+        return answer
+
+    async def solve_many(self, puzzles):
+        """solves puzzles at the same time over the pool (an error of a puzzle is returned in its place)
+
+        :param puzzles: puzzle lines or boards
+        :type puzzles: iterable
+        :return: the solution lines (None for no solution , ServiceError for an error) in the order of the puzzles
+        :rtype: list
+        """
+        return await asyncio.gather(*(self.solve(puzzle) for puzzle in puzzles), return_exceptions=True)
+
+    async def stats(self):
+        """returns the counters of the server (see Server.SolvingServer.stats)
+
+        :rtype: dict
+        """
+        return json.loads(await self.ask("stats"))
+
+    async def close(self):
+        """closes all the connections"""
+        while self.idle:
+            _, writer = self.idle.pop()
+            writer.close()
+            await writer.wait_closed()
+            self.open -= 1
@@ -0,0 +1,270 @@
+"""Exact cover solver backend of the sudoku (Knuth's Algorithm X with Dancing Links)
+
+A sudoku of N*N cubes is an exact cover problem with 4*N*N constraint columns (every cube has a number, every row,
+column and box has every number once) and N*N*N candidate rows (number 'num' in cube (row,col)), 324 columns and
+729 rows for the regular 9x9 board.
+The links are kept in flat lists instead of node objects, covering and uncovering a column only relinks integers.
+
+The file contains the following functions and classes:
+    :class ExactCover: a generic Dancing Links matrix that finds exact covers
+    :func SudokuMatrix: builds the exact cover matrix of a sudoku and covers the given numbers
+    :func SudokuSolver: solves a sudoku in place with the same contract as Solver.SudokuSolver
+"""
+
+import Solver
+
+
+class ExactCover:
+    """A class that represents a sparse 0/1 matrix as Dancing Links
+
+    Node 0 is the root, nodes 1..columns are the column headers and the rest are the cells of the rows.
+
+    :atr self.left, self.right, self.up, self.down: the links of every node
+    :type self.left: list (int)
+    :atr self.column: the column header of every node
+    :type self.column: list (int)
+    :atr self.row_of: the row id of every node (-1 for the headers)
+    :type self.row_of: list (int)
+    :atr self.count: amount of nodes that are still linked in every column
+    :type self.count: list (int)
+    :atr self.first: the first node of every row id
+    :type self.first: dict (int: int)
+
+    :method __init__: Initiates the class
+    :method add_row: adds a row with 1 in the given columns
+    :method cover: unlinks a column and all the rows that use it
+    :method uncover: links back a column that was covered (in reverse order of covering)
+    :method select: covers all the columns of a row (puts the row in the solution)
+    :method deselect: uncovers all the columns of a row that was selected
+    :method solutions: a generator that yields every exact cover of the columns left
+
+    :param columns: amount of constraint columns
+    :type columns: int
+    """
+    def __init__(self, columns):
+        """Initiates the class"""
+        nodes = columns + 1
+        self.left = [i - 1 for i in range(nodes)]
+        self.right = [i + 1 for i in range(nodes)]
+        self.left[0] = columns
+        self.right[columns] = 0
+        self.up = list(range(nodes))
+        self.down = list(range(nodes))
+        self.column = list(range(nodes))
+        self.row_of = [-1] * nodes
+        self.count = [0] * nodes
+        self.first = {}
+
+    def add_row(self, row_id, columns):
+        """adds a row with 1 in the given columns
+
+        :param row_id: the id that will be returned in the solutions
+        :type row_id: int
+        :param columns: the constraint columns of this row (starting with 0)
+        :type columns: list (int)
+        """
+        first = len(self.column)
+        for index, col in enumerate(columns):
+            header = col + 1
+            node = first + index
+            self.column.append(header)
+            self.row_of.append(row_id)
+            self.up.append(self.up[header])
+            self.down.append(header)
+            self.down[self.up[header]] = node
+            self.up[header] = node
+            self.left.append(node - 1)
+            self.right.append(node + 1)
+            self.count[header] += 1
+        last = len(self.column) - 1
+        self.left[first] = last
+        self.right[last] = first
+        self.first[row_id] = first
+
+    def cover(self, header):
+        """unlinks a column and all the rows that use it
+
+        :param header: the column header node
+        :type header: int
+        """
+        left, right, up, down, column, count = self.left, self.right, self.up, self.down, self.column, self.count
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        i = down[header]
+        while i != header:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                count[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def uncover(self, header):
+        """links back a column that was covered (in reverse order of covering)
+
+        :param header: the column header node
+        :type header: int
+        """
+        left, right, up, down, column, count = self.left, self.right, self.up, self.down, self.column, self.count
+        i = up[header]
+        while i != header:
+            j = left[i]
+            while j != i:
+                count[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[header]] = header
+        left[right[header]] = header
+
+    def select(self, node):
+        """covers all the columns of a row (puts the row in the solution)
+
+        :param node: any node of the row , its own column must already be covered
+        :type node: int
+        """
+        j = self.right[node]
+        while j != node:
+            self.cover(self.column[j])
+            j = self.right[j]
+
+    def deselect(self, node):
+        """uncovers all the columns of a row that was selected
+
+        :param node: the same node that was given to select
+        :type node: int
+        """
+        j = self.left[node]
+        while j != node:
+            self.uncover(self.column[j])
+            j = self.left[j]
+
+    def solutions(self, chosen=None, trace=None):
+        """a generator that yields every exact cover of the columns left
+
+        Always branches on the column with the fewest rows left.
+        The yielded list is the same list object all the time, copy it if it is kept after the next step.
+
+        :param chosen: the row ids that are already in the solution (default is None)
+        :type chosen: list (int)
+        :param trace: a function called with (row_id, True) when a row is chosen and (row_id, False) when it is
+         taken back (default is None)
+        :type trace: function
+        :return: generator of lists of row ids
+        """
+        if chosen is None:
+            chosen = []
+        right, down, count = self.right, self.down, self.count
+        header = right[0]
+        if header == 0:
+            yield chosen
+            return
+        best, best_count = header, count[header]
+        while header != 0 and best_count > 1:
+            if count[header] < best_count:
+                best, best_count = header, count[header]
+            header = right[header]
+        if best_count == 0:
+            return
+        self.cover(best)
+        node = down[best]
+        while node != best:
+            row_id = self.row_of[node]
+            chosen.append(row_id)
+            self.select(node)
+            if trace is not None:
+                trace(row_id, True)
+            yield from self.solutions(chosen, trace)
+            self.deselect(node)
+            chosen.pop()
+            if trace is not None:
+                trace(row_id, False)
+            node = down[node]
+        self.uncover(best)
+
+
+def SudokuMatrix(sudoku):
+    """builds the exact cover matrix of a sudoku and covers the given numbers
+
+    Row id of 'num' in cube (row,col) is (row*N + col)*N + num-1.
+
+    :param sudoku: sudoku board
+    :type sudoku: list (int*int)
+    :return: the matrix , or None if the given numbers break the rules
+    """
+    n = len(sudoku)
+    size = Solver.BoxSize(n)
+    area = n * n
+    matrix = ExactCover(4 * area)
+    for row in range(n):
+        for col in range(n):
+            box = (row // size) * size + col // size
+            for digit in range(n):
+                matrix.add_row((row * n + col) * n + digit, [row * n + col, area + row * n + digit,
+                                                             2 * area + col * n + digit, 3 * area + box * n + digit])
+    covered = set()
+    for row in range(n):
+        for col in range(n):
+            num = sudoku[row][col]
+            if num == 0:
+                continue
+            if not 1 <= num <= n:
+                return None
+            node = matrix.first[(row * n + col) * n + num - 1]
+            headers = [matrix.column[node + i] for i in range(4)]
+            if covered.intersection(headers):
+                return None
+            covered.update(headers)
+            matrix.cover(headers[0])
+            matrix.select(node)
+    return matrix
+
+
+def SudokuSolver(sudoku, moves=None, stats=None):
+    """Solves a Sudoku in place with Dancing Links
+
+    Same contract as Solver.SudokuSolver: the board is filled when a solution is found and left as it was when not,
+    and every number put and taken back is written to moves (reversed at the end, like the GUI expects).
+
+    :param sudoku: a given matrix with numbers (0 in the empty places)
+    :type sudoku: list (int*int)
+    :param moves: a list given by the GUI program to write all the moves there to later on show them (default is None)
+    :type moves: list (Solver.Cube) or Trace.MoveTrace
+    :param stats: counters to fill while solving (checks are not counted by this backend) , its callback can stop the
+     search (default is None)
+    :type stats: Solver.SolverStats
+    :return: true if Sudoku was solved , false if not
+    """
+    n = len(sudoku)
+    matrix = SudokuMatrix(sudoku)
+    if matrix is None:
+        return False
+    record = Solver.Recorder(moves)
+    depth = [0]
+
+    def trace(row_id, placed):
+        """writes the move of a chosen or taken back row and counts it"""
+        if record is not None:
+            cell, digit = divmod(row_id, n)
+            record(cell // n, cell % n, digit + 1, placed)
+        if stats is not None:
+            if placed:
+                depth[0] += 1
+                stats.node(depth[0])
+            else:
+                depth[0] -= 1
+                stats.backtracks += 1
+
+    try:
+        for solution in matrix.solutions(trace=None if moves is None and stats is None else trace):
+            for row_id in solution:
+                cell, digit = divmod(row_id, n)
+                sudoku[cell // n][cell % n] = digit + 1
+            if moves is not None:
+                moves.reverse()
+            return True
+    except Solver.SearchCancelled:
+        pass
+    return False
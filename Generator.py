@@ -0,0 +1,174 @@
+"""Generates new sudokus with a single solution and rates how hard they are
+
+A full random grid is made by filling the boxes on the diagonal (they don't share rows or columns) with random
+permutations, solving the rest (drawing the boxes again when they can't be completed) and shuffling the numbers, the
+rows inside bands and the bands.
+Clues are then removed in random order while the puzzle keeps a single solution. A single CandidateState is kept for
+the whole removal: taking a clue out only has to prove that no other number fits in that cube, which is one search
+for any solution over the same masks instead of counting solutions from scratch.
+
+The rating runs the deductions of Propagation.py from the easiest to the hardest and counts the search nodes needed
+when the deductions are not enough.
+
+The file contains the following functions and classes:
+    :class Rating: the level of a puzzle , the techniques it needed and the search nodes
+    :func RandomGrid: makes a full random board
+    :func RemoveClues: removes clues from a full board while it keeps a single solution
+    :func Generate: makes a new puzzle and its solution
+    :func Rate: rates how hard a puzzle is
+    :func Puzzles: an endless generator of rated puzzles
+"""
+
+import random
+from collections import namedtuple
+import Solver
+import Propagation
+import Trace
+
+# the levels from the easiest , and the stages that are enough to solve a puzzle of each level (search for the last)
+LEVELS = ("easy", "medium", "hard", "expert")
+LEVEL_STAGES = (
+    ("naked_singles",),
+    ("naked_singles", "hidden_singles"),
+    tuple(Propagation.STAGES),
+)
+
+Rating = namedtuple('Rating', ['level', 'techniques', 'nodes'])
+
+
+def RandomGrid(n=9, rng=random):
+    """makes a full random board
+
+    :param n: amount of cubes in each side (default is 9)
+    :type n: int
+    :param rng: the random numbers source (default is the random module)
+    :type rng: random.Random
+    :return: a full legal board
+    :rtype: list (int*int)
+    """
+    size = Solver.BoxSize(n)
+    # the diagonal boxes don't always have a completion (often when n=4) , then they are drawn again
+    while True:
+        grid = [[0] * n for _ in range(n)]
+        for box in range(size):
+            nums = rng.sample(range(1, n + 1), n)
+            for i, num in enumerate(nums):
+                grid[box * size + i // size][box * size + i % size] = num
+        if Solver.SudokuSolver(grid):
+            break
+    # relabel the numbers , shuffle the rows inside every band and the bands themselves
+    labels = [0] + rng.sample(range(1, n + 1), n)
+    bands = rng.sample(range(size), size)
+    order = [band * size + row for band in bands for row in rng.sample(range(size), size)]
+    return [[labels[num] for num in grid[row]] for row in order]
+
+
+def RemoveClues(grid, rng=random, keep=0):
+    """removes clues from a full board while it keeps a single solution
+
+    Every cube is tried once in random order. Removing the clue of a cube keeps the solution single exactly when no
+    other candidate of that cube leads to a solution, which is checked with CountSearch(state, 1) on the shared state.
+
+    :param grid: a full legal board (isn't changed)
+    :type grid: list (int*int)
+    :param rng: the random numbers source (default is the random module)
+    :type rng: random.Random
+    :param keep: stop when only this amount of clues is left (default is 0 , remove as many as possible)
+    :type keep: int
+    :return: the puzzle
+    :rtype: list (int*int)
+    """
+    n = len(grid)
+    puzzle = Solver.CopyBoard(grid)
+    state = Solver.CandidateState(puzzle)
+    size = state.size
+    clues = n * n
+    for cube in rng.sample(range(n * n), n * n):
+        if clues <= keep:
+            break
+        row, col = divmod(cube, n)
+        box = (row // size) * size + col // size
+        num = puzzle[row][col]
+        state.remove(row, col, box, num)
+        others = state.candidates(row, col, box) & ~(1 << num)
+        other_solution = False
+        while others and not other_solution:
+            bit = others & -others
+            others ^= bit
+            state.place(row, col, box, bit.bit_length() - 1)
+            other_solution = Solver.CountSearch(state, 1) > 0
+            state.remove(row, col, box, bit.bit_length() - 1)
+        if other_solution:
+            state.place(row, col, box, num)
+        else:
+            state.empty.append((row, col, box))
+            clues -= 1
+    return puzzle
+
+
+def Generate(n=9, rng=random, keep=0):
+    """makes a new puzzle and its solution
+
+    :param n: amount of cubes in each side (default is 9)
+    :type n: int
+    :param rng: the random numbers source (default is the random module)
+    :type rng: random.Random
+    :param keep: stop removing clues at this amount (default is 0 , remove as many as possible)
+    :type keep: int
+    :return: the puzzle (with a single solution) and its solution
+    :rtype: tuple (list (int*int), list (int*int))
+    """
+    grid = RandomGrid(n, rng)
+    if not all(all(row) for row in grid):
+        raise RuntimeError("the random grid isn't full")
+    puzzle = RemoveClues(grid, rng, keep)
+    if Solver.CountSolutions(puzzle, 2) != 1:
+        raise RuntimeError("the generated puzzle doesn't have a single solution")
+    return puzzle, grid
+
+
+def Rate(sudoku):
+    """rates how hard a puzzle is
+
+    The level is the first one whose stages solve the puzzle on their own, or "expert" when a search is needed.
+    The techniques are the stages that changed something in the last run and nodes is the amount of numbers the
+    search put (0 when no search was needed).
+
+    :param sudoku: a puzzle (isn't changed)
+    :type sudoku: list (int*int)
+    :return: the rating
+    :rtype: Rating
+    """
+    for level, stages in zip(LEVELS, LEVEL_STAGES):
+        board = Solver.CopyBoard(sudoku)
+        prop, possible = Propagation.Reduce(board, stages)
+        if not possible:
+            raise ValueError("the puzzle has no solution")
+        techniques = tuple(stage for stage in stages if prop.filled[stage] or prop.eliminated[stage])
+        if all(all(row) for row in board):
+            return Rating(level, techniques, 0)
+    moves = Trace.MoveTrace()
+    if not Solver.SudokuSolver(board, moves):
+        raise ValueError("the puzzle has no solution")
+    return Rating(LEVELS[-1], techniques, sum(1 for move in moves if move.color))
+
+
+def Puzzles(n=9, level=None, seed=None):
+    """an endless generator of rated puzzles
+
+    :param n: amount of cubes in each side (default is 9)
+    :type n: int
+    :param level: only yield puzzles of this level (default is None , all levels)
+    :type level: str
+    :param seed: seed of the random numbers (default is None)
+    :type seed: int
+    :return: generator of (puzzle , solution , rating)
+    """
+    if level is not None and level not in LEVELS:
+        raise ValueError("unknown level: %r" % (level,))
+    rng = random.Random(seed)
+    while True:
+        puzzle, solution = Generate(n, rng)
+        rating = Rate(puzzle)
+        if level is None or rating.level == level:
+            yield puzzle, solution, rating
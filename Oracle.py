@@ -0,0 +1,139 @@
+"""Tells if putting a number keeps a sudoku solvable without searching again for every question
+
+The solutions of a board are searched once (at most two , enough to know if the board has a single solution) and kept
+in a bounded LRU cache keyed by a compact key of the board. While the board has a single solution every question is
+answered by looking at that solution, and accepting a right number moves the same entry to the key of the new board.
+Only a board with more than one solution falls back to a full search for every question.
+
+The file contains the following functions and classes:
+    :func BoardKey: a compact hashable key of a board
+    :class SolvabilityOracle: the cache of solutions and the questions about it
+"""
+
+from collections import OrderedDict
+import Solver
+
+
+def BoardKey(sudoku):
+    """a compact hashable key of a board (one byte for every cube)
+
+    :param sudoku: sudoku board
+    :type sudoku: list (int*int) or Board.Board
+    :return: the key
+    :rtype: bytes
+    """
+    if not isinstance(sudoku, list):
+        return sudoku.key()
+    return bytes(num for row in sudoku for num in row)
+
+
+class SolvabilityOracle:
+    """A class that answers if a number can be put on a board and the board still be solved
+
+    :atr self.maxsize: the biggest amount of boards kept in the cache
+    :type self.maxsize: int
+    :atr self.cache: amount of solutions (0, 1 or 2) and the single solution (flat , or None) of every known board
+    :type self.cache: OrderedDict (bytes: (int, bytes))
+    :atr self.hits: amount of questions answered from the cache
+    :type self.hits: int
+    :atr self.misses: amount of boards that had to be searched
+    :type self.misses: int
+
+    :method __init__: Initiates the class
+    :method store: puts an entry in the cache and drops the least recently used ones above maxsize
+    :method solutions: returns the cache entry of a board , searching it when it is not known
+    :method check: checks if a number can be put in a cube and the board still be solved
+    :method accept: moves the entry of a board to the board with a new number in it
+
+    :param maxsize: the biggest amount of boards kept in the cache (default is 64)
+    :type maxsize: int
+    """
+    def __init__(self, maxsize=64):
+        """Initiates the class"""
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def store(self, key, entry):
+        """puts an entry in the cache and drops the least recently used ones above maxsize
+
+        :param key: the key of the board
+        :type key: bytes
+        :param entry: amount of solutions and the single solution
+        :type entry: tuple (int, bytes)
+        """
+        self.cache[key] = entry
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+
+    def solutions(self, sudoku, key=None):
+        """returns the cache entry of a board , searching it when it is not known
+
+        :param sudoku: sudoku board
+        :type sudoku: list (int*int)
+        :param key: the key of the board if it is already known (default is None)
+        :type key: bytes
+        :return: amount of solutions (0, 1 or 2 for more) and the single solution as a flat key (None if not single)
+        :rtype: tuple (int, bytes)
+        """
+        if key is None:
+            key = BoardKey(sudoku)
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return entry
+        self.misses += 1
+        found = []
+        count = Solver.CountSolutions(sudoku, 2, solutions=found)
+        entry = (count, BoardKey(found[0]) if count == 1 else None)
+        self.store(key, entry)
+        return entry
+
+    def check(self, sudoku, row, col, num):
+        """checks if a number can be put in a cube and the board still be solved
+
+        :param sudoku: sudoku board (isn't changed)
+        :type sudoku: list (int*int)
+        :param row: row index
+        :type row: int
+        :param col: column index
+        :type col: int
+        :param num: the number
+        :type num: int
+        :return: true if the board can be solved with the number , false if not
+        """
+        count, solution = self.solutions(sudoku)
+        if count == 0:
+            return False
+        if count == 1:
+            return solution[row * len(sudoku) + col] == num
+        if not Solver.CheckIfLegal(sudoku, row, col, num):
+            return False
+        tmp = Solver.CopyBoard(sudoku)
+        tmp[row][col] = num
+        return self.solutions(tmp)[0] > 0
+
+    def accept(self, sudoku, row, col, num):
+        """moves the entry of a board to the board with a new number in it (call before putting the number)
+
+        A board with a single solution keeps it after one of its numbers is put, so nothing is searched.
+
+        :param sudoku: sudoku board before the number is put (isn't changed)
+        :type sudoku: list (int*int)
+        :param row: row index
+        :type row: int
+        :param col: column index
+        :type col: int
+        :param num: the number
+        :type num: int
+        """
+        key = BoardKey(sudoku)
+        entry = self.cache.get(key)
+        if entry is None or entry[0] != 1:
+            return
+        new_key = bytearray(key)
+        new_key[row * len(sudoku) + col] = num
+        self.store(bytes(new_key), entry)
@@ -0,0 +1,173 @@
+"""Solves a single hard sudoku over a pool of processes by splitting its search tree
+
+The search is cut into parts , each part is the board with some more numbers put, and the parts are disjoint: together
+they hold every solution exactly once. A worker searches a part for a slice of nodes (see Solver.ResumableSearch); if
+the slice ends before the part is done, the rest of the part goes back to the queue as new parts (the subtree it was
+in and the numbers not tried yet at every level, see Remaining). So a big part is split again and again while idle
+workers take the pieces , and no worker is stuck on a part much longer than a slice.
+As soon as enough solutions were found the parts that didn't start are cancelled and the running ones end with their
+slice.
+
+The file contains the following functions:
+    :func Remaining: the rest of an unfinished search as parts
+    :func SearchPart: searches a part for a slice of nodes (runs inside the workers)
+    :func ParallelSearch: searches a board over a pool of processes
+    :func ParallelSolver: solves a board in place over a pool of processes
+    :func ParallelCount: counts the solutions of a board over a pool of processes
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import os
+import Board
+import Solver
+
+# amount of nodes a worker searches a part before it splits the rest
+SLICE_NODES = 20000
+# amount of nodes of the first split (done in this process) for every worker
+FIRST_SPLIT_NODES = 4
+
+
+def Remaining(search):
+    """the rest of an unfinished search as parts (the search can't go on after that)
+
+    The parts are the subtree under the last number put and , from the deepest level up , a part for every number that
+    wasn't tried yet in the cube of that level.
+
+    :param search: the unfinished search
+    :type search: Solver.ResumableSearch
+    :return: the parts as puzzle lines , the deepest first
+    :rtype: list (str)
+    """
+    board = search.state.board
+    parts = [Solver.BoardToLine(board)]
+    for _, row, col, _, mask, _ in reversed(search.stack):
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            board[row][col] = bit.bit_length() - 1
+            parts.append(Solver.BoardToLine(board))
+        board[row][col] = 0
+    return parts
+
+
+def SearchPart(line, limit=1, nodes=SLICE_NODES):
+    """searches a part for a slice of nodes (runs inside the workers)
+
+    :param line: the part as a puzzle line
+    :type line: str
+    :param limit: stop after this amount of solutions , None finds them all (default is 1)
+    :type limit: int
+    :param nodes: the amount of nodes of the slice (default is SLICE_NODES)
+    :type nodes: int
+    :return: the solutions found , the parts left (empty when the part is done) and the amount of nodes searched
+    :rtype: tuple (list (str), list (str), int)
+    """
+    board = Board.Board.from_line(line)
+    search = Solver.ResumableSearch(board)
+    found = []
+    while True:
+        status = search.run(max(nodes - search.nodes, 1))
+        if status == Solver.UNSOLVABLE:
+            return found, [], search.nodes
+        if status == Solver.UNFINISHED:
+            return found, Remaining(search), search.nodes
+        found.append(board.to_line())
+        if limit is not None and len(found) >= limit:
+            return found, [], search.nodes
+        search.skip()
+
+
+def ParallelSearch(sudoku, limit=1, processes=None, nodes=SLICE_NODES):
+    """searches a board over a pool of processes
+
+    :param sudoku: sudoku board (isn't changed)
+    :type sudoku: list (int*int) or Board.Board
+    :param limit: stop after this amount of solutions , None finds them all (default is 1)
+    :type limit: int
+    :param processes: amount of worker processes , 1 searches in this process (default is the amount of cpus)
+    :type processes: int
+    :param nodes: the amount of nodes a worker searches a part before it splits the rest (default is SLICE_NODES)
+    :type nodes: int
+    :return: the solutions found (at most limit) as puzzle lines and the amount of nodes searched
+    :rtype: tuple (list (str), int)
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    found, parts, searched = SearchPart(Solver.BoardToLine(sudoku), limit, FIRST_SPLIT_NODES * processes)
+    parts = deque(parts)
+
+    def enough():
+        """true when the search can stop"""
+        return limit is not None and len(found) >= limit
+
+    def collect(result):
+        """adds the result of a part , the parts left go first so the search stays close to depth first"""
+        nonlocal searched
+        solutions, rest, count = result
+        found.extend(solutions)
+        parts.extendleft(reversed(rest))
+        searched += count
+
+    if processes == 1:
+        while parts and not enough():
+            collect(SearchPart(parts.popleft(), None if limit is None else limit - len(found), nodes))
+        return found[:limit], searched
+
+    with ProcessPoolExecutor(processes) as pool:
+        running = set()
+        while (parts or running) and not enough():
+            # two parts for every worker , so a worker never waits for the next one
+            while parts and len(running) < 2 * processes:
+                need = None if limit is None else limit - len(found)
+                running.add(pool.submit(SearchPart, parts.popleft(), need, nodes))
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                collect(future.result())
+        for future in running:
+            future.cancel()
+    return found[:limit], searched
+
+
+def ParallelSolver(sudoku, processes=None, nodes=SLICE_NODES):
+    """solves a board in place over a pool of processes
+
+    :param sudoku: a given matrix with numbers (0 in the empty places)
+    :type sudoku: list (int*int) or Board.Board
+    :param processes: amount of worker processes , 1 searches in this process (default is the amount of cpus)
+    :type processes: int
+    :param nodes: the amount of nodes a worker searches a part before it splits the rest (default is SLICE_NODES)
+    :type nodes: int
+    :return: true if Sudoku was solved , false if not
+    """
+    found, _ = ParallelSearch(sudoku, 1, processes, nodes)
+    if not found:
+        return False
+    solution = Board.Board.from_line(found[0])
+    for row in range(len(sudoku)):
+        sudoku[row][:] = solution[row]
+    return True
+
+
+def ParallelCount(sudoku, limit=2, processes=None, nodes=SLICE_NODES, solutions=None):
+    """counts the solutions of a board over a pool of processes (like Solver.CountSolutions)
+
+    :param sudoku: a given matrix with numbers (0 in the empty places) , isn't changed
+    :type sudoku: list (int*int) or Board.Board
+    :param limit: stop after this amount of solutions , None counts them all (default is 2)
+    :type limit: int
+    :param processes: amount of worker processes , 1 searches in this process (default is the amount of cpus)
+    :type processes: int
+    :param nodes: the amount of nodes a worker searches a part before it splits the rest (default is SLICE_NODES)
+    :type nodes: int
+    :param solutions: a list to write every solution found into , as boards (default is None)
+    :type solutions: list (list (int*int))
+    :return: amount of solutions (at most limit)
+    :rtype: int
+    """
+    if limit is not None and limit < 1:
+        return 0
+    found, _ = ParallelSearch(sudoku, limit, processes, nodes)
+    if solutions is not None:
+        solutions.extend(Solver.LineToBoard(line) for line in found)
+    return len(found)
@@ -0,0 +1,310 @@
+"""Logical deductions that fill a sudoku before the backtracking search
+
+Each deduction is a stage , a function that gets a Propagator and returns how many changes it made (numbers put or
+candidates removed). The stages run in the given order until none of them changes anything, starting again from the
+first one after every change so the cheap stages do most of the work.
+
+The file contains the following functions and classes:
+    :class Contradiction: raised by a stage when the board can't be solved
+    :class Propagator: candidates of every cube and the units (rows, columns and boxes) of a board
+    :func NakedSingles: puts the number of every cube that has a single candidate
+    :func HiddenSingles: puts a number that has a single place left in a unit
+    :func NakedPairs: two cubes of a unit with the same two candidates remove them from the rest of the unit
+    :func HiddenPairs: two numbers with the same two places in a unit remove the other candidates of those cubes
+    :func PointingClaiming: a number limited to one line in a box (or one box in a line) is removed from the rest
+    :func Reduce: runs the stages on a board until nothing changes
+"""
+
+import Solver
+
+
+class Contradiction(Exception):
+    """raised by a stage when the board can't be solved"""
+
+
+class Propagator:
+    """A class that holds the candidates of every cube of a board
+
+    :atr self.board: the sudoku (changed in place)
+    :type self.board: list (int*int)
+    :atr self.n: amount of cubes each side
+    :type self.n: int
+    :atr self.cands: candidates mask of every cube by index row*n+col (0 for the filled cubes)
+    :type self.cands: list (int)
+    :atr self.units: the cubes of every row, column and box
+    :type self.units: list (list (int))
+    :atr self.peers: the cubes that share a unit with every cube
+    :type self.peers: list (list (int))
+    :atr self.record: writes the numbers put on the board into the moves (see Solver.Recorder) , or None
+    :type self.record: function
+    :atr self.placed: the indices of the cubes filled by the stages , in order
+    :type self.placed: list (int)
+    :atr self.filled: amount of cubes filled by every stage
+    :type self.filled: dict (str: int)
+    :atr self.eliminated: amount of candidates removed by every stage
+    :type self.eliminated: dict (str: int)
+    :atr self.stage: name of the stage that is running
+    :type self.stage: str
+
+    :method __init__: Initiates the class
+    :method place: puts a number and removes it from the candidates of the peers (a peer left without any raises)
+    :method eliminate: removes candidates from a cube
+    :method undo: empties all the cubes the stages filled
+
+    :param sudoku: sudoku board
+    :type sudoku: list (int*int)
+    :param moves: a list or Trace.MoveTrace to write the numbers put on the board into (default is None)
+    :type moves: list (Solver.Cube) or Trace.MoveTrace
+    """
+    def __init__(self, sudoku, moves=None):
+        """Initiates the class"""
+        self.board = sudoku
+        self.n = n = len(sudoku)
+        size = Solver.BoxSize(n)
+        self.units = [[row * n + col for col in range(n)] for row in range(n)]
+        self.units += [[row * n + col for row in range(n)] for col in range(n)]
+        self.units += [[(box // size * size + i // size) * n + box % size * size + i % size for i in range(n)]
+                       for box in range(n)]
+        self.peers = [set() for _ in range(n * n)]
+        for unit in self.units:
+            for cube in unit:
+                self.peers[cube].update(unit)
+        self.peers = [sorted(peers - {cube}) for cube, peers in enumerate(self.peers)]
+        self.record = Solver.Recorder(moves)
+        self.placed = []
+        self.filled = {}
+        self.eliminated = {}
+        self.stage = None
+
+        state = Solver.CandidateState(sudoku)
+        if not state.valid:
+            raise Contradiction("the given numbers break the rules")
+        self.cands = [0] * (n * n)
+        for row, col, box in state.empty:
+            self.cands[row * n + col] = state.candidates(row, col, box)
+
+    def place(self, cube, num):
+        """puts a number and removes it from the candidates of the peers
+
+        :param cube: the cube index (row*n+col)
+        :type cube: int
+        :param num: the number
+        :type num: int
+        """
+        row, col = divmod(cube, self.n)
+        if not self.cands[cube] >> num & 1:
+            raise Contradiction("%d can't be put in (%d,%d)" % (num, row, col))
+        self.board[row][col] = num
+        self.cands[cube] = 0
+        # kept before the peers are checked , so undo empties the cube even when they raise
+        self.placed.append(cube)
+        self.filled[self.stage] = self.filled.get(self.stage, 0) + 1
+        if self.record is not None:
+            self.record(row, col, num, True)
+        bit = 1 << num
+        for peer in self.peers[cube]:
+            # only the empty peers have candidates , one left with none can't be filled anymore
+            if self.cands[peer] & bit:
+                self.cands[peer] ^= bit
+                if not self.cands[peer]:
+                    raise Contradiction("no candidates left in (%d,%d)" % divmod(peer, self.n))
+
+    def eliminate(self, cube, mask):
+        """removes candidates from a cube
+
+        :param cube: the cube index (row*n+col)
+        :type cube: int
+        :param mask: the candidates to remove
+        :type mask: int
+        :return: amount of candidates removed
+        :rtype: int
+        """
+        removed = self.cands[cube] & mask
+        if not removed:
+            return 0
+        self.cands[cube] ^= removed
+        if not self.cands[cube]:
+            raise Contradiction("no candidates left in (%d,%d)" % divmod(cube, self.n))
+        count = bin(removed).count("1")
+        self.eliminated[self.stage] = self.eliminated.get(self.stage, 0) + count
+        return count
+
+    def undo(self):
+        """empties all the cubes the stages filled (the moves get a removal for each of them)"""
+        for cube in reversed(self.placed):
+            row, col = divmod(cube, self.n)
+            if self.record is not None:
+                self.record(row, col, self.board[row][col], False)
+            self.board[row][col] = 0
+        self.placed = []
+
+
+def NakedSingles(prop):
+    """puts the number of every cube that has a single candidate
+
+    :param prop: the board candidates
+    :type prop: Propagator
+    :return: amount of changes
+    """
+    changes = 0
+    for cube, mask in enumerate(prop.cands):
+        if mask and not mask & (mask - 1):
+            prop.place(cube, mask.bit_length() - 1)
+            changes += 1
+    return changes
+
+
+def HiddenSingles(prop):
+    """puts a number that has a single place left in a unit
+
+    :param prop: the board candidates
+    :type prop: Propagator
+    :return: amount of changes
+    """
+    changes = 0
+    board, cands, n = prop.board, prop.cands, prop.n
+    for unit in prop.units:
+        used = 0
+        for cube in unit:
+            used |= 1 << board[cube // n][cube % n]
+        for num in range(1, n + 1):
+            if used >> num & 1:
+                continue
+            bit = 1 << num
+            places = [cube for cube in unit if cands[cube] & bit]
+            if not places:
+                raise Contradiction("%d has no place left in a unit" % num)
+            if len(places) == 1:
+                prop.place(places[0], num)
+                used |= bit
+                changes += 1
+    return changes
+
+
+def NakedPairs(prop):
+    """two cubes of a unit with the same two candidates remove them from the rest of the unit
+
+    :param prop: the board candidates
+    :type prop: Propagator
+    :return: amount of changes
+    """
+    changes = 0
+    cands = prop.cands
+    for unit in prop.units:
+        seen = {}
+        for cube in unit:
+            mask = cands[cube]
+            if bin(mask).count("1") != 2:
+                continue
+            if mask not in seen:
+                seen[mask] = cube
+                continue
+            for other in unit:
+                if other != cube and other != seen[mask]:
+                    changes += prop.eliminate(other, mask)
+    return changes
+
+
+def HiddenPairs(prop):
+    """two numbers with the same two places in a unit remove the other candidates of those cubes
+
+    :param prop: the board candidates
+    :type prop: Propagator
+    :return: amount of changes
+    """
+    changes = 0
+    cands, n = prop.cands, prop.n
+    for unit in prop.units:
+        seen = {}
+        for num in range(1, n + 1):
+            bit = 1 << num
+            places = tuple(cube for cube in unit if cands[cube] & bit)
+            if len(places) != 2:
+                continue
+            if places not in seen:
+                seen[places] = num
+                continue
+            keep = bit | 1 << seen[places]
+            for cube in places:
+                changes += prop.eliminate(cube, ~keep)
+    return changes
+
+
+def PointingClaiming(prop):
+    """a number limited to one line in a box (or one box in a line) is removed from the rest
+
+    Pointing: the places of a number inside a box are all in one row/column , so the number can't be anywhere else in
+    that row/column. Claiming: the places of a number inside a row/column are all in one box , so the number can't be
+    anywhere else in that box.
+
+    :param prop: the board candidates
+    :type prop: Propagator
+    :return: amount of changes
+    """
+    changes = 0
+    cands, n = prop.cands, prop.n
+    size = Solver.BoxSize(n)
+    rows, cols, boxes = prop.units[:n], prop.units[n:2 * n], prop.units[2 * n:]
+    for num in range(1, n + 1):
+        bit = 1 << num
+        for box in boxes:
+            places = [cube for cube in box if cands[cube] & bit]
+            if len(places) < 2:
+                continue
+            for lines, of in ((rows, lambda cube: cube // n), (cols, lambda cube: cube % n)):
+                if len({of(cube) for cube in places}) == 1:
+                    for cube in lines[of(places[0])]:
+                        if cube not in box:
+                            changes += prop.eliminate(cube, bit)
+        for line in rows + cols:
+            places = [cube for cube in line if cands[cube] & bit]
+            if len(places) < 2:
+                continue
+            box_of = {(cube // n // size) * size + cube % n // size for cube in places}
+            if len(box_of) == 1:
+                for cube in boxes[box_of.pop()]:
+                    if cube not in line:
+                        changes += prop.eliminate(cube, bit)
+    return changes
+
+
+# the stages by name , in the order they run by default (cheap ones first)
+STAGES = {
+    "naked_singles": NakedSingles,
+    "hidden_singles": HiddenSingles,
+    "naked_pairs": NakedPairs,
+    "hidden_pairs": HiddenPairs,
+    "pointing": PointingClaiming,
+}
+
+
+def Reduce(sudoku, stages=tuple(STAGES), moves=None):
+    """runs the stages on a board until nothing changes
+
+    The board is changed in place and keeps the numbers the stages put even when a contradiction is found.
+
+    :param sudoku: sudoku board
+    :type sudoku: list (int*int)
+    :param stages: names of STAGES or stage functions , in the order they run (default is all the stages)
+    :type stages: iterable
+    :param moves: a list to write the numbers put on the board into (default is None)
+    :type moves: list (Solver.Cube)
+    :return: the propagator (its filled/eliminated counts by stage) and false if a contradiction was found
+    :rtype: tuple (Propagator, bool)
+    """
+    stages = [(stage, STAGES[stage]) if isinstance(stage, str) else (stage.__name__, stage) for stage in stages]
+    try:
+        prop = Propagator(sudoku, moves)
+    except Contradiction:
+        return None, False
+    for name, _ in stages:
+        prop.filled.setdefault(name, 0)
+        prop.eliminated.setdefault(name, 0)
+    try:
+        index = 0
+        while index < len(stages):
+            prop.stage, stage = stages[index]
+            index = 0 if stage(prop) else index + 1
+    except Contradiction:
+        return prop, False
+    return prop, True
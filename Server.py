@@ -0,0 +1,311 @@
+"""A local solving service: an asyncio server that solves puzzles sent over a TCP or Unix socket
+
+The protocol is one line for every request and one line for every answer , in the order of the requests of that
+connection (a client may send many lines before it reads the answers):
+    a puzzle line (see Solver.LineToBoard)  ->  its solution , "none" (no solution) , "error <message>" or "timeout"
+    "stats"                                 ->  the counters of the server as one JSON line
+Requests of all the connections go into one bounded queue and are taken out in micro-batches (up to batch_size
+puzzles , or whatever arrived within batch_delay seconds) that are solved by Batch.SolveLines in a pool of processes.
+When the queue is full the connections stop reading , so the clients are slowed down by TCP itself (backpressure).
+A request that isn't answered within timeout seconds (waiting included) gets "timeout" , and the search of every
+puzzle is limited to timeout seconds as well so no worker is stuck on an adversarial puzzle.
+
+Usage:
+    python -m sudoku serve --port 8765
+    python -m sudoku serve --unix /tmp/sudoku.sock --processes 4
+
+The file contains the following classes:
+    :class SolvingServer: the server , its batching and its counters
+"""
+
+import asyncio
+import functools
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import Batch
+
+# amount of latencies kept for the percentiles
+LATENCY_SAMPLES = 1024
+
+
+class SolvingServer:
+    """A class that serves puzzles over a socket and solves them in micro-batches over a pool of processes
+
+    :atr self.processes: amount of worker processes
+    :type self.processes: int
+    :atr self.backend: the name of the solving algorithm (see Solver.SudokuSolver)
+    :type self.backend: str
+    :atr self.batch_size: the most puzzles in a batch
+    :type self.batch_size: int
+    :atr self.batch_delay: the most seconds a batch waits for more puzzles
+    :type self.batch_delay: float
+    :atr self.timeout: seconds until a request is answered with "timeout" (None for no limit)
+    :type self.timeout: float
+    :atr self.max_pending: the most requests waiting in the queue
+    :type self.max_pending: int
+    :atr self.queue: the requests waiting for a batch (puzzle line , future of the answer , arrival time)
+    :type self.queue: asyncio.Queue
+    :atr self.slots: the amount of batches that may be solved at the same time
+    :type self.slots: asyncio.Semaphore
+    :atr self.pool: the worker processes
+    :type self.pool: concurrent.futures.ProcessPoolExecutor
+    :atr self.server: the listening server (None before start)
+    :type self.server: asyncio.AbstractServer
+    :atr self.batcher_task: the task that runs batcher (None before start)
+    :type self.batcher_task: asyncio.Task
+    :atr self.connections: the tasks of the open connections
+    :type self.connections: set (asyncio.Task)
+    :atr self.batches: the tasks of the batches being solved
+    :type self.batches: set (asyncio.Task)
+    :atr self.counters: amount of requests , answers of every kind , batches and puzzles in batches
+    :type self.counters: dict (str: int)
+    :atr self.latencies: seconds from arrival to answer of the last requests
+    :type self.latencies: deque (float)
+    :atr self.started: the time the server started (time.perf_counter)
+    :type self.started: float
+
+    :method __init__: Initiates the class
+    :method start: starts the workers and listens on a TCP port or a Unix socket
+    :method close: stops listening , closes the connections and the batches and stops the workers
+    :method request: puts a puzzle in the queue (waits while it is full) and returns the future of its answer
+    :method handle: serves a single connection
+    :method respond: writes the answers of a connection in the order of its requests
+    :method batcher: takes micro-batches out of the queue and sends them to the workers
+    :method solve_batch: solves a batch in the workers and answers its requests
+    :method stats: returns the counters
+
+    :param processes: amount of worker processes (default is the amount of cpus)
+    :type processes: int
+    :param backend: the name of the solving algorithm (default is "bitmask")
+    :type backend: str
+    :param batch_size: the most puzzles in a batch (default is 64)
+    :type batch_size: int
+    :param batch_delay: the most seconds a batch waits for more puzzles (default is 0.002)
+    :type batch_delay: float
+    :param max_pending: the most requests waiting in the queue (default is 1024)
+    :type max_pending: int
+    :param timeout: seconds until a request is answered with "timeout" (default is 10 , None for no limit)
+    :type timeout: float
+    """
+    def __init__(self, processes=None, backend="bitmask", batch_size=64, batch_delay=0.002, max_pending=1024,
+                 timeout=10.0):
+        """Initiates the class"""
+        self.processes = processes or os.cpu_count() or 1
+        self.backend = backend
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.timeout = timeout
+        self.max_pending = max_pending
+        # made in start , inside the running loop
+        self.queue = None
+        self.slots = None
+        self.pool = None
+        self.server = None
+        self.batcher_task = None
+        self.connections = set()
+        self.batches = set()
+        self.counters = {"requests": 0, "solved": 0, "none": 0, "errors": 0, "timeouts": 0, "batches": 0,
+                         "batched": 0}
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.started = time.perf_counter()
+
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        """starts the workers and listens on a TCP port or a Unix socket
+
+        :param host: the address to listen on (default is "127.0.0.1" , local only)
+        :type host: str
+        :param port: the TCP port , 0 picks a free one (default is 0)
+        :type port: int
+        :param path: a Unix socket path to listen on instead of TCP (default is None)
+        :type path: str
+        :return: the port (or the path) the server listens on
+        :rtype: int or str
+        """
+        loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(self.max_pending)
+        self.slots = asyncio.Semaphore(2 * self.processes)
+        self.pool = ProcessPoolExecutor(self.processes)
+        # starts every worker now so the first requests don't pay for it
+        await asyncio.gather(*(loop.run_in_executor(self.pool, Batch.SolveLines, [], self.backend)
+                               for _ in range(self.processes)))
+        self.batcher_task = asyncio.create_task(self.batcher())
+        self.started = time.perf_counter()
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle, path=path)
+            return path
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """stops listening , closes the open connections , cancels the batches being solved and stops the workers"""
+        if self.server is not None:
+            self.server.close()
+            for task in self.connections:
+                task.cancel()
+            await asyncio.gather(*self.connections, return_exceptions=True)
+            await self.server.wait_closed()
+        if self.batcher_task is not None:
+            self.batcher_task.cancel()
+        for task in self.batches:
+            task.cancel()
+        await asyncio.gather(*self.batches, return_exceptions=True)
+        if self.pool is not None:
+            # waiting for the workers to exit blocks , so it is done in a thread and the loop keeps running
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(self.pool.shutdown, wait=True, cancel_futures=True))
+
+    async def request(self, line):
+        """puts a puzzle in the queue (waits while it is full) and returns the future of its answer
+
+        :param line: the puzzle line
+        :type line: str
+        :rtype: asyncio.Future
+        """
+        answer = asyncio.get_running_loop().create_future()
+        self.counters["requests"] += 1
+        await self.queue.put((line, answer, time.perf_counter()))
+        return answer
+
+    async def handle(self, reader, writer):
+        """serves a single connection: reads its requests and lets respond write the answers
+
+        :param reader: the incoming side of the connection
+        :type reader: asyncio.StreamReader
+        :param writer: the outgoing side of the connection
+        :type writer: asyncio.StreamWriter
+        """
+        connection = asyncio.current_task()
+        self.connections.add(connection)
+        answers = asyncio.Queue()
+        responder = asyncio.create_task(self.respond(answers, writer))
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                text = line.decode("ascii", "replace").strip()
+                if not text:
+                    continue
+                if text == "stats":
+                    answer = asyncio.get_running_loop().create_future()
+                    answer.set_result(json.dumps(self.stats()))
+                    await answers.put((answer, time.perf_counter()))
+                    continue
+                arrived = time.perf_counter()
+                await answers.put((await self.request(text), arrived))
+            await answers.put(None)
+            await responder
+        except (ConnectionError, asyncio.CancelledError):
+            # a broken connection (or the server closing it) drops the answers it still waits for; the cancel isn't
+            # raised again since asyncio (before 3.12) reports a cancelled connection task as an error
+            responder.cancel()
+        finally:
+            self.connections.discard(connection)
+            writer.close()
+
+    async def respond(self, answers, writer):
+        """writes the answers of a connection in the order of its requests
+
+        :param answers: the futures of the answers (and their arrival time) , None after the last one
+        :type answers: asyncio.Queue
+        :param writer: the outgoing side of the connection
+        :type writer: asyncio.StreamWriter
+        """
+        while True:
+            item = await answers.get()
+            if item is None:
+                return
+            answer, arrived = item
+            try:
+                if self.timeout is None:
+                    text = await answer
+                else:
+                    left = self.timeout - (time.perf_counter() - arrived)
+                    text = await asyncio.wait_for(asyncio.shield(answer), max(left, 0))
+            except asyncio.TimeoutError:
+                self.counters["timeouts"] += 1
+                text = "timeout"
+            try:
+                writer.write(text.encode("ascii") + b"\n")
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+    async def batcher(self):
+        """takes micro-batches out of the queue and sends them to the workers"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size:
+                if self.queue.empty():
+                    left = deadline - loop.time()
+                    if left <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.queue.get(), left))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(self.queue.get_nowait())
+            await self.slots.acquire()
+            # the loop only keeps a weak reference to a task , the set keeps it alive until it is done
+            task = asyncio.create_task(self.solve_batch(batch))
+            self.batches.add(task)
+            task.add_done_callback(self.batches.discard)
+
+    async def solve_batch(self, batch):
+        """solves a batch in the workers and answers its requests
+
+        :param batch: the requests (puzzle line , future of the answer , arrival time)
+        :type batch: list (tuple)
+        """
+        try:
+            self.counters["batches"] += 1
+            self.counters["batched"] += len(batch)
+            lines = [line for line, _, _ in batch]
+            try:
+                results = await asyncio.get_running_loop().run_in_executor(
+                    self.pool, Batch.SolveLines, lines, self.backend, False, None, self.timeout)
+            except Exception as error:
+                results = [(None, "%s: %s" % (type(error).__name__, error), None)] * len(batch)
+            now = time.perf_counter()
+            for (_, answer, arrived), (solution, error, _) in zip(batch, results):
+                if error is not None:
+                    self.counters["errors"] += 1
+                    text = "error " + error
+                elif solution is None:
+                    self.counters["none"] += 1
+                    text = "none"
+                else:
+                    self.counters["solved"] += 1
+                    text = solution
+                self.latencies.append(now - arrived)
+                if not answer.done():
+                    answer.set_result(text)
+        finally:
+            self.slots.release()
+
+    def stats(self):
+        """returns the counters: the requests and answers , the batches , the queue , the throughput (answers a second
+        since the start) and the latency (average , median , 99th percentile and maximum of the last requests)
+
+        :rtype: dict
+        """
+        stats = dict(self.counters)
+        answered = stats["solved"] + stats["none"] + stats["errors"]
+        uptime = time.perf_counter() - self.started
+        latencies = sorted(self.latencies)
+        stats["pending"] = self.queue.qsize() if self.queue is not None else 0
+        stats["uptime"] = uptime
+        stats["throughput"] = answered / uptime if uptime else 0.0
+        stats["batch_average"] = stats["batched"] / stats["batches"] if stats["batches"] else 0.0
+        if latencies:
+            stats["latency_average"] = sum(latencies) / len(latencies)
+            stats["latency_median"] = latencies[len(latencies) // 2]
+            stats["latency_p99"] = latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)]
+            stats["latency_max"] = latencies[-1]
+        return stats
@@ -1,9 +1,21 @@
 import math
+import sys
+import time
 import collections
 from collections import namedtuple
 
+# default amount of cubes in each side , every board carries its own size (len(sudoku)) which can be any perfect square
 N = 9
 
+# characters of the numbers in the one line format (numbers above 9 are letters , 'A' is 10)
+SYMBOLS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# levels of recursion kept free for the callers of Search , deeper boards use ResumableSearch
+RECURSION_MARGIN = 100
+
+# a single move of the solver as the GUI replays it (color is True when placed, False when removed)
+Cube = namedtuple('Cube', ['row', 'col', 'num', 'color'])
+
 
 def PrintSudoku(sudoku):
     """runs throughout all the sudoku and prints its values
@@ -11,12 +23,97 @@ def PrintSudoku(sudoku):
     :param sudoku: sudoku board
     :type sudoku: list (int*int)
     """
-    for i in range(N):
-        for j in range(N):
-            print(str(sudoku[i][j]), end=" ")
+    for row in sudoku:
+        for num in row:
+            print(SYMBOLS[num], end=" ")
         print()
 
 
+def BoxSize(n):
+    """returns the amount of cubes in each side of a box of a board with n cubes in each side
+
+    :param n: amount of cubes in each side of the board
+    :type n: int
+    :return: the box size
+    :rtype: int
+    """
+    size = math.isqrt(n)
+    if n < 1 or size * size != n:
+        raise ValueError("the board size must be a perfect square , got %d" % n)
+    return size
+
+
+_bit_counts = {}
+
+
+def BitCounts(n):
+    """returns a table with the amount of set bits of every candidates mask of a board with n cubes each side
+
+    The table is built once for every size and only for boards up to 16x16 (bigger tables cost more than they save).
+
+    :param n: amount of cubes in each side of the board
+    :type n: int
+    :return: the table (index is the mask) or None for bigger boards
+    :rtype: list (int)
+    """
+    if n > 16:
+        return None
+    if n not in _bit_counts:
+        table = [0] * (1 << (n + 1))
+        for mask in range(1, len(table)):
+            table[mask] = table[mask >> 1] + (mask & 1)
+        _bit_counts[n] = table
+    return _bit_counts[n]
+
+
+def LineToBoard(line):
+    """turns a puzzle written in one line (81 characters for 9x9 , '0' or '.' in the empty places) into a board
+
+    The size of the board comes from the length of the line (256 characters for 16x16 , 625 for 25x25) and numbers
+    above 9 are written as letters (see SYMBOLS).
+
+    :param line: the puzzle line
+    :type line: str
+    :return: sudoku board
+    :rtype: list (int*int)
+    """
+    line = line.strip()
+    n = math.isqrt(len(line))
+    if n * n != len(line):
+        raise ValueError("a puzzle line must have n*n characters , got %d" % len(line))
+    BoxSize(n)
+    values = [0 if char == '.' else int(char, 36) for char in line]
+    if max(values) > n:
+        raise ValueError("a puzzle line of size %d has a number above %d" % (n, n))
+    return [values[row * n:(row + 1) * n] for row in range(n)]
+
+
+def BoardToLine(sudoku):
+    """writes a board as one line of characters ('0' in the empty places)
+
+    :param sudoku: sudoku board
+    :type sudoku: list (int*int) or Board.Board
+    :return: the puzzle line
+    :rtype: str
+    """
+    if not isinstance(sudoku, list):
+        return sudoku.to_line()
+    return "".join(SYMBOLS[num] for row in sudoku for num in row)
+
+
+def CopyBoard(sudoku):
+    """copies a board , a list of lists row by row and a Board.Board with a single slice of its buffer
+
+    :param sudoku: sudoku board
+    :type sudoku: list (int*int) or Board.Board
+    :return: the copy (of the same type)
+    :rtype: list (int*int) or Board.Board
+    """
+    if isinstance(sudoku, list):
+        return [row[:] for row in sudoku]
+    return sudoku.copy()
+
+
 def CheckEmptySpace(sudoku):
     """finds the first empty space (value 0) and returns index , returns -1,-1 if space not found
 
@@ -24,8 +121,8 @@ def CheckEmptySpace(sudoku):
     :type sudoku: list (int*int)
     :return : index if empty space or -1,-1 if not found
     """
-    for i in range(N):
-        for j in range(N):
+    for i in range(len(sudoku)):
+        for j in range(len(sudoku)):
             if sudoku[i][j] == 0:
                 return i, j
     return -1,-1
@@ -42,7 +139,7 @@ def CheckRow(sudoku, row, num):
     :type num: int
     :return: true if not found , false if found
     """
-    for col in range(N):
+    for col in range(len(sudoku)):
         if sudoku[row][col] == num:
             return False
     return True
@@ -59,7 +156,7 @@ def CheckCol(sudoku, col, num):
     :type num: int
     :return: true if not found , false if found
     """
-    for row in range(N):
+    for row in range(len(sudoku)):
         if sudoku[row][col] == num:
             return False
     return True
@@ -78,10 +175,11 @@ def CheckGrid(sudoku, row, col, num):
     :type num: int
     :return: true if not found , false if found
     """
-    gridRow = (row//math.isqrt(N))*math.isqrt(N)
-    gridCol = (col // math.isqrt(N)) * math.isqrt(N)
-    for i in range(math.isqrt(N)):
-        for j in range(math.isqrt(N)):
+    size = math.isqrt(len(sudoku))
+    gridRow = (row // size) * size
+    gridCol = (col // size) * size
+    for i in range(size):
+        for j in range(size):
             if sudoku[i+gridRow][j+gridCol] == num and sudoku[i+gridRow][j+gridCol] != sudoku[row][col]:
                 return False
     return True
@@ -103,40 +201,664 @@ def CheckIfLegal(sudoku, row, col, num):
     return CheckRow(sudoku, row, num) and CheckCol(sudoku, col, num) and CheckGrid(sudoku, row, col, num)
 
 
-def SudokuSolver(sudoku, moves=None):
-    """A recursive function that solves a Sudoku
+class CandidateState:
+    """Digit masks of every row, column and box of a sudoku , kept up to date on every placement
 
-    It starts from the first blanc space and enters a loop.
-    Starts from 1, picks it and enters the function recursively to look for the next blanc space.
-    If the picked number is illegal then goes through the loop again and gives the next number.
-    If the loop ended and all the numbers didn't fit , then return to the previous entered number and continue its loop.
-    The function ends when it reaches last index in the Sudoku
+    Bit 'num' of a mask is set when 'num' is already used in that row/column/box, so the candidates of an empty
+    cube are the bits that are missing from all three of its masks.
 
-    :param sudoku: a given matrix with numbers (0 in the empty places)
-    :type sudoku: list (int*int)
-    :param moves: a list given by the GUI program to write all the moves there to later on show them (default is None)
-    :type moves: list (int*int)
-    :return: true if Sudoku was solved , false if not
+    :atr self.board: the sudoku that is being solved (changed in place)
+    :type self.board: list (int*int) or Board.Board
+    :atr self.grid: the rows of the board (the same row objects , so writing them changes the board) in a plain list
+     so a Board.Board row is found without calling its __getitem__
+    :type self.grid: list
+    :atr self.n: amount of cubes in each side of the board
+    :type self.n: int
+    :atr self.size: amount of cubes in each side of the box
+    :type self.size: int
+    :atr self.full: mask with the bits of all the legal numbers set
+    :type self.full: int
+    :atr self.rows: used numbers of each row
+    :type self.rows: list (int)
+    :atr self.cols: used numbers of each column
+    :type self.cols: list (int)
+    :atr self.boxes: used numbers of each box
+    :type self.boxes: list (int)
+    :atr self.empty: the empty cubes left on the board (row, col, box)
+    :type self.empty: list ([(int,int,int),...])
+    :atr self.valid: false if the given numbers already break the rules
+    :type self.valid: bool
+    :atr self.counts: amount of candidates of every mask (see BitCounts)
+    :type self.counts: list (int)
+
+    :method __init__: Initiates the class
+    :method place: puts a number on the board and updates the masks
+    :method remove: removes a number from the board and updates the masks
+    :method candidates: returns the mask of the numbers that can be put in a cube
+    :method most_constrained: finds the empty cube with the fewest candidates
+
+    :param sudoku: sudoku board
+    :type sudoku: list (int*int) or Board.Board
     """
-    row, col = CheckEmptySpace(sudoku)
-    cube = namedtuple('Cube', ['row', 'col', 'num', 'color'])
-    if row == -1 and col == -1:
-        if moves is not None:
-            moves.reverse()
+    def __init__(self, sudoku):
+        """Initiates the class"""
+        self.board = sudoku
+        self.grid = list(sudoku)
+        self.n = len(sudoku)
+        self.size = BoxSize(self.n)
+        self.full = (1 << (self.n + 1)) - 2
+        self.rows = [0] * self.n
+        self.cols = [0] * self.n
+        self.boxes = [0] * self.n
+        self.empty = []
+        self.valid = True
+        self.counts = BitCounts(self.n)
+        for row in range(self.n):
+            for col in range(self.n):
+                box = (row // self.size) * self.size + col // self.size
+                num = self.grid[row][col]
+                if num == 0:
+                    self.empty.append((row, col, box))
+                    continue
+                if not 0 < num <= self.n:
+                    self.valid = False
+                    continue
+                bit = 1 << num
+                if (self.rows[row] | self.cols[col] | self.boxes[box]) & bit:
+                    self.valid = False
+                self.rows[row] |= bit
+                self.cols[col] |= bit
+                self.boxes[box] |= bit
+
+    def place(self, row, col, box, num):
+        """puts a number on the board and updates the masks
+
+        :param row: row index
+        :type row: int
+        :param col: column index
+        :type col: int
+        :param box: box index
+        :type box: int
+        :param num: the number to put
+        :type num: int
+        """
+        bit = 1 << num
+        self.grid[row][col] = num
+        self.rows[row] |= bit
+        self.cols[col] |= bit
+        self.boxes[box] |= bit
+
+    def remove(self, row, col, box, num):
+        """removes a number from the board and updates the masks
+
+        :param row: row index
+        :type row: int
+        :param col: column index
+        :type col: int
+        :param box: box index
+        :type box: int
+        :param num: the number to remove
+        :type num: int
+        """
+        bit = ~(1 << num)
+        self.grid[row][col] = 0
+        self.rows[row] &= bit
+        self.cols[col] &= bit
+        self.boxes[box] &= bit
+
+    def candidates(self, row, col, box):
+        """returns the mask of the numbers that can be put in a cube
+
+        :param row: row index
+        :type row: int
+        :param col: column index
+        :type col: int
+        :param box: box index
+        :type box: int
+        :return: mask with the bits of the legal numbers set
+        """
+        return self.full & ~(self.rows[row] | self.cols[col] | self.boxes[box])
+
+    def most_constrained(self):
+        """finds the empty cube with the fewest candidates
+
+        The search stops early on a cube with one candidate (nothing can beat it) or none (dead end).
+
+        :return: position of the cube in self.empty and its candidates mask, or -1,0 if there are no empty cubes
+        """
+        best, best_mask, best_count = -1, 0, self.n + 1
+        rows, cols, boxes, full, counts = self.rows, self.cols, self.boxes, self.full, self.counts
+        for index, (row, col, box) in enumerate(self.empty):
+            mask = full & ~(rows[row] | cols[col] | boxes[box])
+            count = counts[mask] if counts is not None else bin(mask).count("1")
+            if count < best_count:
+                best, best_mask, best_count = index, mask, count
+                if count <= 1:
+                    break
+        return best, best_mask
+
+
+class SearchCancelled(Exception):
+    """raised inside the search when the callback of SolverStats asked to stop"""
+
+
+class SolverStats:
+    """Counters of a single solve , filled by SudokuSolver when given
+
+    Nothing is counted when no SolverStats is given , the search runs without any of the counting code.
+
+    :atr self.nodes: amount of numbers the search put
+    :type self.nodes: int
+    :atr self.checks: amount of legality checks (candidate masks of a cube that were computed , the mask lookup that
+     replaced CheckIfLegal)
+    :type self.checks: int
+    :atr self.backtracks: amount of numbers the search took back
+    :type self.backtracks: int
+    :atr self.max_depth: the deepest level of the search
+    :type self.max_depth: int
+    :atr self.phases: seconds spent in every phase ("propagation", "search")
+    :type self.phases: dict (str: float)
+    :atr self.propagation: amount of cubes filled by every propagation stage
+    :type self.propagation: dict (str: int)
+    :atr self.cancelled: true if the callback stopped the search
+    :type self.cancelled: bool
+    :atr self.callback: called with the stats every 'every' nodes , returning true stops the search
+    :type self.callback: function
+    :atr self.every: amount of nodes between the callback calls
+    :type self.every: int
+
+    :method __init__: Initiates the class
+    :method node: counts a number put by the search and calls the callback when it is time
+    :method as_dict: returns the counters as a dict (for JSON)
+    :method summary: returns the counters as one line of text
+
+    :param callback: called with the stats every 'every' nodes , returning true stops the search (default is None)
+    :type callback: function
+    :param every: amount of nodes between the callback calls (default is 1000)
+    :type every: int
+    """
+    def __init__(self, callback=None, every=1000):
+        """Initiates the class"""
+        self.nodes = 0
+        self.checks = 0
+        self.backtracks = 0
+        self.max_depth = 0
+        self.phases = {}
+        self.propagation = {}
+        self.cancelled = False
+        self.callback = callback
+        self.every = every
+
+    def node(self, depth):
+        """counts a number put by the search and calls the callback when it is time
+
+        :param depth: the level of the search the number was put in
+        :type depth: int
+        """
+        self.nodes += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+        if self.callback is not None and self.nodes % self.every == 0 and self.callback(self):
+            self.cancelled = True
+            raise SearchCancelled()
+
+    def as_dict(self):
+        """returns the counters as a dict (for JSON)
+
+        :rtype: dict
+        """
+        return {"nodes": self.nodes, "checks": self.checks, "backtracks": self.backtracks,
+                "max_depth": self.max_depth, "phases": dict(self.phases), "propagation": dict(self.propagation),
+                "cancelled": self.cancelled}
+
+    def summary(self):
+        """returns the counters as one line of text
+
+        :rtype: str
+        """
+        return "nodes %d  backtracks %d  checks %d  depth %d  %.3f s" % (
+            self.nodes, self.backtracks, self.checks, self.max_depth, sum(self.phases.values()))
+
+
+def Recorder(moves):
+    """returns a function that writes a move (row, col, num, placed) into moves
+
+    A Trace.MoveTrace (anything with a record method) gets its moves packed without creating a Cube for each, any
+    other list gets Cube objects appended.
+
+    :param moves: the list or trace to write into , or None
+    :return: the function , or None when moves is None
+    """
+    if moves is None:
+        return None
+    record = getattr(moves, "record", None)
+    if record is not None:
+        return record
+    return lambda row, col, num, placed: moves.append(Cube(row, col, num, placed))
+
+
+def Search(state, record=None):
+    """A recursive function that fills the empty cubes of a CandidateState
+
+    Always branches on the empty cube with the fewest candidates and tries only those candidates, smallest first.
+    When a branch fails the number is removed again so the board is left as it was given.
+
+    :param state: the masks of the sudoku being solved
+    :type state: CandidateState
+    :param record: a function that writes every move (see Recorder) (default is None)
+    :type record: function
+    :return: true if the board was filled , false if not
+    """
+    index, mask = state.most_constrained()
+    if index == -1:
         return True
+    empty = state.empty
+    # takes the cube out of the empty list (swap with the last one so it stays O(1))
+    empty[index], empty[-1] = empty[-1], empty[index]
+    row, col, box = empty.pop()
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        num = bit.bit_length() - 1
+        state.place(row, col, box, num)
+        if record is not None:
+            record(row, col, num, True)
+        if Search(state, record):
+            return True
+        state.remove(row, col, box, num)
+        if record is not None:
+            record(row, col, num, False)
+    empty.append((row, col, box))
+    empty[index], empty[-1] = empty[-1], empty[index]
+    return False
+
+
+def InstrumentedSearch(state, record, stats, depth=1):
+    """Search that also fills a SolverStats (kept apart so Search itself has no counting code)
 
-    for num in range(1, N+1):
-        if CheckIfLegal(sudoku, row, col, num):
-            sudoku[row][col] = num
-            if moves is not None:
-                newC = cube(row, col, num, True)
-                moves.append(newC)
-            if SudokuSolver(sudoku, moves):
-                return True
-            sudoku[row][col]=0
-            if moves is not None:
-                newC = cube(row, col, num, False)
-                moves.append(newC)
+    :param state: the masks of the sudoku being solved
+    :type state: CandidateState
+    :param record: a function that writes every move (see Recorder) , or None
+    :type record: function
+    :param stats: the counters to fill
+    :type stats: SolverStats
+    :param depth: the level of this call (default is 1)
+    :type depth: int
+    :return: true if the board was filled , false if not
+    """
+    index, mask = state.most_constrained()
+    # most_constrained stops on the first cube with at most one candidate , otherwise it checked all of them
+    stats.checks += index + 1 if index != -1 and not mask & (mask - 1) else len(state.empty)
+    if index == -1:
+        return True
+    empty = state.empty
+    empty[index], empty[-1] = empty[-1], empty[index]
+    row, col, box = empty.pop()
+    while mask:
+        bit = mask & -mask
+        mask ^= bit
+        num = bit.bit_length() - 1
+        state.place(row, col, box, num)
+        if record is not None:
+            record(row, col, num, True)
+        stats.node(depth)
+        if InstrumentedSearch(state, record, stats, depth + 1):
+            return True
+        state.remove(row, col, box, num)
+        stats.backtracks += 1
+        if record is not None:
+            record(row, col, num, False)
+    empty.append((row, col, box))
+    empty[index], empty[-1] = empty[-1], empty[index]
     return False
 
 
+# the results of ResumableSearch.run
+SOLVED = "solved"
+UNSOLVABLE = "unsolvable"
+UNFINISHED = "unfinished"
+
+
+class ResumableSearch:
+    """The search of Search with its own stack instead of recursion , so it can stop and go on later
+
+    Every level of the stack is [index, row, col, box, mask, num]: the position the cube had in state.empty, the cube,
+    the candidates not tried yet and the number put in it now (0 for none). run() goes on from where the last call
+    stopped until the board is solved, proven unsolvable or the budget (nodes and/or seconds) ran out.
+    It does not depend on the recursion limit , so it also solves boards with more empty cubes than the limit.
+
+    :atr self.state: the masks of the sudoku being solved (its board is changed in place)
+    :type self.state: CandidateState
+    :atr self.record: a function that writes every move (see Recorder) , or None
+    :type self.record: function
+    :atr self.moves: the moves given (reversed when solved , like SudokuSolver does)
+    :type self.moves: list (Cube) or Trace.MoveTrace
+    :atr self.stats: counters to fill , or None
+    :type self.stats: SolverStats
+    :atr self.prop: the propagation that ran before the search (undone when unsolvable) , or None
+    :type self.prop: Propagation.Propagator
+    :atr self.stack: the levels of the search
+    :type self.stack: list (list)
+    :atr self.descend: true when the next step picks a new cube , false when it tries the next number of the last one
+    :type self.descend: bool
+    :atr self.nodes: amount of numbers put so far (over all the runs)
+    :type self.nodes: int
+    :atr self.status: SOLVED , UNSOLVABLE or UNFINISHED
+    :type self.status: str
+
+    :method __init__: Initiates the class
+    :method run: goes on with the search until it ends or the budget runs out
+    :method skip: goes on past the solution that was found , so the next run looks for another one
+
+    :param sudoku: a given matrix with numbers (0 in the empty places) , solved in place
+    :type sudoku: list (int*int)
+    :param moves: a list or Trace.MoveTrace to write all the moves into (default is None)
+    :type moves: list (Cube) or Trace.MoveTrace
+    :param stats: counters to fill , its callback stops the run as unfinished (default is None)
+    :type stats: SolverStats
+    """
+    def __init__(self, sudoku, moves=None, stats=None):
+        """Initiates the class"""
+        self.state = CandidateState(sudoku)
+        self.record = Recorder(moves)
+        self.moves = moves
+        self.stats = stats
+        self.prop = None
+        self.stack = []
+        self.descend = True
+        self.nodes = 0
+        self.status = UNFINISHED if self.state.valid else UNSOLVABLE
+
+    def run(self, nodes=None, seconds=None):
+        """goes on with the search until it ends or the budget runs out
+
+        :param nodes: the most numbers to put in this run (default is None , no limit)
+        :type nodes: int
+        :param seconds: the most wall clock time of this run , checked every 256 nodes (default is None , no limit)
+        :type seconds: float
+        :return: SOLVED , UNSOLVABLE or UNFINISHED (then calling run again goes on)
+        :rtype: str
+        """
+        if self.status != UNFINISHED:
+            return self.status
+        state, stack, record, stats = self.state, self.stack, self.record, self.stats
+        empty = state.empty
+        deadline = None if seconds is None else time.perf_counter() + seconds
+        limit = None if nodes is None else self.nodes + nodes
+        try:
+            while True:
+                if self.descend:
+                    index, mask = state.most_constrained()
+                    if stats is not None:
+                        stats.checks += index + 1 if index != -1 and not mask & (mask - 1) else len(empty)
+                    if index == -1:
+                        self.status = SOLVED
+                        if self.moves is not None:
+                            self.moves.reverse()
+                        return SOLVED
+                    empty[index], empty[-1] = empty[-1], empty[index]
+                    row, col, box = empty.pop()
+                    stack.append([index, row, col, box, mask, 0])
+                    self.descend = False
+                frame = stack[-1]
+                index, row, col, box, mask, num = frame
+                if num:
+                    state.remove(row, col, box, num)
+                    frame[5] = 0
+                    if record is not None:
+                        record(row, col, num, False)
+                    if stats is not None:
+                        stats.backtracks += 1
+                if not mask:
+                    stack.pop()
+                    empty.append((row, col, box))
+                    empty[index], empty[-1] = empty[-1], empty[index]
+                    if not stack:
+                        self.status = UNSOLVABLE
+                        if self.prop is not None:
+                            self.prop.undo()
+                        return UNSOLVABLE
+                    continue
+                bit = mask & -mask
+                num = bit.bit_length() - 1
+                frame[4] = mask ^ bit
+                frame[5] = num
+                state.place(row, col, box, num)
+                if record is not None:
+                    record(row, col, num, True)
+                self.nodes += 1
+                self.descend = True
+                if stats is not None:
+                    stats.node(len(stack))
+                if limit is not None and self.nodes >= limit:
+                    return UNFINISHED
+                if deadline is not None and not self.nodes & 255 and time.perf_counter() >= deadline:
+                    return UNFINISHED
+        except SearchCancelled:
+            return UNFINISHED
+
+    def skip(self):
+        """goes on past the solution that was found , so the next run looks for another one (for counting , the moves
+        were already reversed when it was found)
+        """
+        if self.status != SOLVED:
+            return
+        if self.stack:
+            self.status = UNFINISHED
+            self.descend = False
+        else:
+            self.status = UNSOLVABLE
+
+
+def SolveWithBudget(sudoku, moves=None, nodes=None, seconds=None, stages=None, stats=None):
+    """Solves a Sudoku in place , but gives up after a budget of nodes and/or seconds
+
+    When the budget runs out the board holds the numbers of the unfinished search , and the returned search goes on
+    with search.run(nodes, seconds).
+
+    :param sudoku: a given matrix with numbers (0 in the empty places)
+    :type sudoku: list (int*int)
+    :param moves: a list or Trace.MoveTrace to write all the moves into (default is None)
+    :type moves: list (Cube) or Trace.MoveTrace
+    :param nodes: the most numbers the search puts (default is None , no limit)
+    :type nodes: int
+    :param seconds: the most wall clock time of the search (default is None , no limit)
+    :type seconds: float
+    :param stages: names of Propagation.STAGES or stage functions to run before the search (default is None)
+    :type stages: iterable
+    :param stats: counters to fill while solving (default is None)
+    :type stats: SolverStats
+    :return: SOLVED , UNSOLVABLE or UNFINISHED and the search
+    :rtype: tuple (str, ResumableSearch)
+    """
+    prop = None
+    if stages:
+        import Propagation
+        prop, possible = Propagation.Reduce(sudoku, stages, moves)
+        if not possible:
+            if prop is not None:
+                prop.undo()
+            return UNSOLVABLE, None
+    search = ResumableSearch(sudoku, moves, stats)
+    search.prop = prop
+    if search.status == UNSOLVABLE and prop is not None:
+        prop.undo()
+    return search.run(nodes, seconds), search
+
+
+def CountSearch(state, limit, solutions=None):
+    """A recursive function that counts the ways to fill the empty cubes of a CandidateState
+
+    Branches like Search but keeps going after a full board until 'limit' boards were found, and always removes the
+    numbers it put so the state is left as it was given.
+
+    :param state: the masks of the sudoku being counted
+    :type state: CandidateState
+    :param limit: stop after this amount of solutions
+    :type limit: int
+    :param solutions: a list to write a copy of every solution into (default is None)
+    :type solutions: list (list (int*int))
+    :return: amount of solutions found (at most limit)
+    """
+    index, mask = state.most_constrained()
+    if index == -1:
+        if solutions is not None:
+            solutions.append(CopyBoard(state.board))
+        return 1
+    empty = state.empty
+    empty[index], empty[-1] = empty[-1], empty[index]
+    row, col, box = empty.pop()
+    found = 0
+    while mask and found < limit:
+        bit = mask & -mask
+        mask ^= bit
+        num = bit.bit_length() - 1
+        state.place(row, col, box, num)
+        found += CountSearch(state, limit - found, solutions)
+        state.remove(row, col, box, num)
+    empty.append((row, col, box))
+    empty[index], empty[-1] = empty[-1], empty[index]
+    return found
+
+
+def CountSolutions(sudoku, limit=2, backend="bitmask", stages=None, solutions=None):
+    """Counts the solutions of a Sudoku without changing it
+
+    The count stops as soon as 'limit' solutions were found , so asking for 2 is enough to tell if a puzzle has a
+    single solution.
+
+    :param sudoku: a given matrix with numbers (0 in the empty places)
+    :type sudoku: list (int*int)
+    :param limit: stop after this amount of solutions , None counts them all (default is 2)
+    :type limit: int
+    :param backend: the name of the solving algorithm , "bitmask" or "dlx" (default is "bitmask")
+    :type backend: str
+    :param stages: names of Propagation.STAGES or stage functions to run before counting (default is None)
+    :type stages: iterable
+    :param solutions: a list to write a copy of every solution found into (default is None)
+    :type solutions: list (list (int*int))
+    :return: amount of solutions (at most limit)
+    :rtype: int
+    """
+    if backend not in ("bitmask", "dlx"):
+        raise ValueError("unknown solver backend: %r" % (backend,))
+    if limit is None:
+        limit = float("inf")
+    if limit < 1:
+        return 0
+    sudoku = CopyBoard(sudoku)
+    if stages:
+        import Propagation
+        if not Propagation.Reduce(sudoku, stages)[1]:
+            return 0
+    if backend == "dlx":
+        import DancingLinks
+        matrix = DancingLinks.SudokuMatrix(sudoku)
+        if matrix is None:
+            return 0
+        found = 0
+        n = len(sudoku)
+        for chosen in matrix.solutions():
+            found += 1
+            if solutions is not None:
+                solution = CopyBoard(sudoku)
+                for row_id in chosen:
+                    cell, digit = divmod(row_id, n)
+                    solution[cell // n][cell % n] = digit + 1
+                solutions.append(solution)
+            if found >= limit:
+                break
+        return found
+    state = CandidateState(sudoku)
+    if not state.valid:
+        return 0
+    return CountSearch(state, limit, solutions)
+
+
+def IsUnique(sudoku, backend="bitmask", stages=None):
+    """Checks if a Sudoku has exactly one solution (without changing it)
+
+    :param sudoku: a given matrix with numbers (0 in the empty places)
+    :type sudoku: list (int*int)
+    :param backend: the name of the solving algorithm , "bitmask" or "dlx" (default is "bitmask")
+    :type backend: str
+    :param stages: names of Propagation.STAGES or stage functions to run before counting (default is None)
+    :type stages: iterable
+    :return: true if there is a single solution , false if there are none or more
+    """
+    return CountSolutions(sudoku, 2, backend, stages) == 1
+
+
+def SudokuSolver(sudoku, moves=None, backend="bitmask", stages=None, stats=None):
+    """Solves a Sudoku in place
+
+    The default backend keeps the used numbers of each row, column and box as bit masks (see CandidateState) and
+    backtracks over the empty cube with the fewest candidates each time, so a legality check is a single mask lookup
+    instead of a scan over the row, column and grid.
+    The "dlx" backend solves the sudoku as an exact cover problem with Dancing Links (see DancingLinks.py), which
+    keeps a predictable running time on puzzles that make backtracking explode.
+    With stages the logical deductions of Propagation.py fill what they can before the search starts (their numbers
+    are written to moves like the searched ones) and only the reduced board is searched.
+
+    :param sudoku: a given matrix with numbers (0 in the empty places)
+    :type sudoku: list (int*int)
+    :param moves: a list given by the GUI program to write all the moves there to later on show them , a
+     Trace.MoveTrace keeps them packed (default is None)
+    :type moves: list (Cube) or Trace.MoveTrace
+    :param backend: the name of the solving algorithm , "bitmask" or "dlx" (default is "bitmask")
+    :type backend: str
+    :param stages: names of Propagation.STAGES or stage functions to run before the search (default is None)
+    :type stages: iterable
+    :param stats: counters to fill while solving , its callback can stop the search (then false is returned and the
+     board is left as it was) (default is None)
+    :type stats: SolverStats
+    :return: true if Sudoku was solved , false if not
+    """
+    if backend not in ("bitmask", "dlx"):
+        raise ValueError("unknown solver backend: %r" % (backend,))
+    prop = None
+    if stages:
+        import Propagation
+        start = time.perf_counter()
+        prop, possible = Propagation.Reduce(sudoku, stages, moves)
+        if stats is not None:
+            stats.phases["propagation"] = time.perf_counter() - start
+            stats.propagation = dict(prop.filled) if prop is not None else {}
+        if not possible:
+            if prop is not None:
+                prop.undo()
+            return False
+    start = time.perf_counter()
+    if backend == "dlx":
+        import DancingLinks
+        solved = DancingLinks.SudokuSolver(sudoku, moves, stats)
+    else:
+        state = CandidateState(sudoku)
+        if not state.valid:
+            solved = False
+        elif len(state.empty) > sys.getrecursionlimit() - RECURSION_MARGIN:
+            # too deep for the recursion , the explicit stack does the same search
+            search = ResumableSearch(sudoku, moves, stats)
+            solved = search.run() == SOLVED
+            if not solved:
+                for row, col, box in state.empty:
+                    sudoku[row][col] = 0
+            # the search already reversed the moves
+            moves = None
+        elif stats is None:
+            solved = Search(state, Recorder(moves))
+        else:
+            empty = list(state.empty)
+            try:
+                solved = InstrumentedSearch(state, Recorder(moves), stats)
+            except SearchCancelled:
+                for row, col, box in empty:
+                    sudoku[row][col] = 0
+                solved = False
+        if solved and moves is not None:
+            moves.reverse()
+    if stats is not None:
+        stats.phases["search"] = time.perf_counter() - start
+    if not solved and prop is not None:
+        prop.undo()
+    return solved
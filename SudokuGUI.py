@@ -13,126 +13,281 @@ The file contains the following functions and classes:
     :class Sudoku: which contains all the cube and implements the necessary actions
     :func menu: which initiates the pygame running loop and sends instructions to Sudoku according to the user
 
-There are constant variables such as: cube size and amount of cubes each side
+There are constant variables such as: the largest cube size and the largest board size, the amount of cubes each side
+comes from the given board (9x9, 16x16, 25x25 ...)
 """
 
-from copy import deepcopy
 import pygame
 import Solver
+import Oracle
+import BackgroundSolver
 
-CUBE_NUMBER = 9
 CUBE_WIDTH = 50
 CUBE_HEIGHT = 50
+# bigger boards get smaller cubes so the window stays at most this wide
+BOARD_PIXELS = 750
+# keys that enter the numbers : 1-9 and then a-z for 10 and above (like Solver.SYMBOLS)
+VALUE_KEYS = [pygame.K_1 + i for i in range(9)] + [pygame.K_a + i for i in range(26)]
+# the most moves of the solver shown in one frame
+MAX_SPEED = 4096
+# frames per second of the main loop
+FPS = 60
+
+# rendered numbers and fonts , made once for every (number, tmp, cube size) and font size
+_glyphs = {}
+_fonts = {}
+
+
+def glyph(value, tmp, pixels):
+    """returns the rendered surface of a number , rendering it only the first time
+
+    :param value: the number
+    :type value: int
+    :param tmp: if the number is the one given by the user (small and grey) or a final one (black)
+    :type tmp: bool
+    :param pixels: the cube size in pixels
+    :type pixels: int
+    :return: the rendered number
+    :rtype: pygame.Surface
+    """
+    key = (value, tmp, pixels)
+    if key not in _glyphs:
+        size = pixels * 23 // 50 if tmp else pixels // 2
+        if size not in _fonts:
+            _fonts[size] = pygame.font.SysFont('gadugi', size)
+        color = (192, 192, 192) if tmp else (0, 0, 0)
+        _glyphs[key] = _fonts[size].render(Solver.SYMBOLS[value], True, color)
+    return _glyphs[key]
+
+
+def cube_pixels(n):
+    """returns the width (and height) in pixels of a cube on a board with n cubes each side
+
+    :param n: amount of cubes each side
+    :type n: int
+    :return: cube size in pixels
+    :rtype: int
+    """
+    return min(CUBE_WIDTH, CUBE_HEIGHT, BOARD_PIXELS // n)
+
+
+def clear_keys(n):
+    """returns the keys that clear a place , 'c' only when it is not used for a number
+
+    :param n: amount of cubes each side
+    :type n: int
+    :return: the keys
+    :rtype: list
+    """
+    keys = [pygame.K_BACKSPACE, pygame.K_DELETE]
+    if pygame.K_c not in VALUE_KEYS[:n]:
+        keys.append(pygame.K_c)
+    return keys
 
 
 class Sudoku:
     """A class that represents the sudoku board
 
     :atr self.board: A matrix that has the current rightful sudoko( you can solve with this one)
-    :type self.board: list (n*n of ints)
+    :type self.board: list (n*n of ints) or Board.Board
+    :atr self.n: amount of cubes each side
+    :type self.n: int
+    :atr self.size: amount of cubes each side of a box
+    :type self.size: int
+    :atr self.pixels: width (and height) of a cube in pixels
+    :type self.pixels: int
     :atr self.cubes: Cube objects located as the the board with the same coordinates
     :type self.cubes:list ( n*n of Cubes)
-    :atr self.move_list: a list that contains the moves that the solving algorithm did (value,row,col)
-    :type self.move_list: list ([(int,int,int),...])
+    :atr self.solver: the solving algorithm running in the background , it sends its moves (row,col,num,color) while
+     it is still searching (None before it started)
+    :type self.solver: BackgroundSolver.BackgroundSolver
+    :atr self.speed: amount of moves shown in every frame
+    :type self.speed: int
     :atr self.auto: A flag that show if the algorithm is running or not
     :type self.auto: bool
-    :atr self.tmp_board: A matrix (copy of self.board) that we can put values there and check if the algorithm can solve
-     it (for manual picking)
-    :type self.tmp_board: list (with int*int in it)
+    :atr self.oracle: Knows the solutions of the board and answers if a number entered by the user keeps it solvable
+     (for manual picking)
+    :type self.oracle: Oracle.SolvabilityOracle
+    :atr self.stats: the counters of the last algorithm that ran (None before it started)
+    :type self.stats: Solver.SolverStats
+    :atr self.status: the statistics text that is shown under the instructions
+    :type self.status: str
 
     :method __init__: Initiates the class
-    :method update: Updates all the time the values (Cubes and board) depending on the status of the class(auto)
-    :method update_tmp_board: Restores the tmp_board to it default position (copy of board)
+    :method update: Updates all the time the values (Cubes and board) depending on the status of the class(auto) and
+     returns the parts of the window that changed
     :method start_solving: Starts the backtracking algorithm and changes the status of the class to auto
+    :method cancel_solving: Stops the algorithm and shows the board as it was before it started
+    :method restart_solving: Stops the algorithm and starts it again from the beginning
+    :method change_speed: Changes the amount of moves shown in every frame
+    :method reset_cubes: Shows the values of the board on all the cubes
     :method submit: Checks if the sudoku can be solved with the given number , and if yes then puts it on the board
     :method cleat_tmp: Removes the number that the user tried to enter
+    :method draw_status: Shows the statistics of the algorithm under the instructions
 
     :param board: the given sudoku (nXn of ints)
-    :type board:list
+    :type board:list or Board.Board
     :param window:the surface of pygame that we draw on it
     :type window: pygame.display
     """
     def __init__(self, board, window):
         """Initiates the class"""
         self.board = board
+        self.n = len(board)
+        self.size = Solver.BoxSize(self.n)
+        self.pixels = cube_pixels(self.n)
         # copies values from the given sudoku
-        self.cubes = [[Cube(board[row][col], row, col, window) for col in range(CUBE_NUMBER)]for
-                      row in range(CUBE_NUMBER)]
-        self.move_list = []
+        self.cubes = [[Cube(board[row][col], row, col, window, self.n, self.pixels) for col in range(self.n)]for
+                      row in range(self.n)]
+        self.solver = None
+        self.speed = 1
         self.auto = False
-        self.tmp_board = []
+        self.oracle = Oracle.SolvabilityOracle()
+        self.stats = None
+        self.status = ""
 
     def update(self, pressed_keys, pressed_mouse, window):
         """Updates all the time the values (Cubes and board) depending on the status of the class(auto)
 
-        If the auto is true (the algorithm is running) then it takes the moves from move_list and inserts and highlight
-        the board accordingly, if not then updates each Cube individually and draws the thick lines ion the board
+        If the auto is true (the algorithm is running) then it takes the next moves (speed of them) that the algorithm
+        sent and inserts and highlight the board accordingly, if not then updates each Cube individually and draws the
+        thick lines ion the board.
+        When the algorithm ended and all its moves were shown the solved board becomes the board and auto is false.
+        Only the cubes that were drawn since the last update are returned (with the thick lines around them), so only
+        they have to be pushed to the screen
 
         :param pressed_keys: The next pressed button in the queue that need to do something
         :param pressed_mouse: The next pressed mouse button in the queue that need to do something
         :param window: The interface of pygame that we are working on
+        :return: the rectangles of the window that changed
+        :rtype: list (pygame.Rect)
         """
-        if self.auto and len(self.move_list) != 0:
-            tmp = self.move_list.pop()
-            row = tmp.row
-            col = tmp.col
-            num = tmp.num
-            self.cubes[row][col].color = tmp.color
-            self.cubes[row][col].is_pressed(window)
-            self.cubes[row][col].set_value(num, False, window)
+        if self.auto and self.solver is not None:
+            for tmp in self.solver.take(self.speed):
+                row = tmp.row
+                col = tmp.col
+                num = tmp.num
+                self.cubes[row][col].color = tmp.color
+                self.cubes[row][col].is_pressed(window)
+                self.cubes[row][col].set_value(num, False, window)
+            if self.solver.done():
+                if self.solver.result:
+                    for row in range(self.n):
+                        self.board[row][:] = self.solver.board[row]
+                # the board is free again (esc and r only work while the moves are shown)
+                self.solver = None
+                self.auto = False
             # updates each cube individually and draws the thick lines on the board
 
-        def should_draw_vertical(col):
-            return col % (CUBE_NUMBER ** 0.5) == 1 and col != 1
-
-        def should_draw_horizontal(row):
-            return row % (CUBE_NUMBER ** 0.5) == 1 and row != 1
-
         [cube.update(pressed_keys, pressed_mouse, window) for row in self.cubes for cube in row]
-        vertical = filter(should_draw_vertical,range(CUBE_NUMBER))
-        horizontal = filter(should_draw_horizontal, range(CUBE_NUMBER))
-        for col in vertical:
-            pygame.draw.line(window, (0, 0, 0), ((col - 1) * CUBE_WIDTH, 0), ((col - 1) * CUBE_HEIGHT,
-                                                                              CUBE_NUMBER * CUBE_WIDTH), 4)
-        for row in horizontal:
-            pygame.draw.line(window, (0, 0, 0), (0, (row - 1) * CUBE_HEIGHT),
-                             (CUBE_NUMBER * CUBE_WIDTH, (row - 1) * CUBE_HEIGHT), 4)
-
-        pygame.draw.line(window, (0, 0, 0), (0, CUBE_NUMBER*CUBE_HEIGHT),
-                         (CUBE_NUMBER*CUBE_WIDTH, CUBE_WIDTH*CUBE_NUMBER), 4)
-
-    def update_tmp_board(self):
-        """Restores the tmp_board to it default position (copy of board)"""
-        self.tmp_board = deepcopy(self.board)
+        dirty = []
+        for row in self.cubes:
+            for cube in row:
+                if cube.dirty:
+                    # the thick lines are 4 pixels wide around the border
+                    dirty.append(pygame.Rect(cube.x, cube.y, cube.width, cube.height).inflate(4, 4))
+                    cube.dirty = False
+        if not dirty:
+            return dirty
+        # a thick line after every box (drawn again since the cubes next to them may have been cleared)
+        side = self.n * self.pixels
+        for line in range(self.size, self.n, self.size):
+            pygame.draw.line(window, (0, 0, 0), (line * self.pixels, 0), (line * self.pixels, side), 4)
+            pygame.draw.line(window, (0, 0, 0), (0, line * self.pixels), (side, line * self.pixels), 4)
+
+        pygame.draw.line(window, (0, 0, 0), (0, side), (side, side), 4)
+        return dirty
 
     def start_solving(self):
-        """Starts the backtracking algorithm and changes the status of the class to auto"""
+        """Starts the backtracking algorithm in the background and changes the status of the class to auto"""
         self.auto = True
-        Solver.SudokuSolver(self.board, self.move_list)
+        self.solver = BackgroundSolver.BackgroundSolver(self.board)
+        self.stats = self.solver.stats
+
+    def cancel_solving(self, window):
+        """Stops the algorithm and shows the board as it was before it started
+
+        :param window: The interface of pygame that we are working on
+        """
+        if self.solver is not None:
+            self.solver.cancel()
+            self.solver = None
+            self.auto = False
+            self.reset_cubes(window)
+
+    def restart_solving(self, window):
+        """Stops the algorithm and starts it again from the beginning
+
+        :param window: The interface of pygame that we are working on
+        """
+        if self.solver is not None:
+            self.cancel_solving(window)
+            self.start_solving()
+
+    def change_speed(self, faster):
+        """Changes the amount of moves shown in every frame (doubles or halves it)
+
+        :param faster: true to show more moves in every frame , false to show less
+        :type faster: bool
+        """
+        if faster:
+            self.speed = min(self.speed * 2, MAX_SPEED)
+        else:
+            self.speed = max(self.speed // 2, 1)
+
+    def draw_status(self, window):
+        """Shows the statistics of the algorithm under the instructions (only when they changed)
+
+        :param window: The interface of pygame that we are working on
+        :return: the rectangles of the window that changed
+        :rtype: list (pygame.Rect)
+        """
+        if self.stats is None:
+            return []
+        text = " " + self.stats.summary()
+        if text == self.status:
+            return []
+        self.status = text
+        rect = pygame.Rect(0, self.n * self.pixels + 100, self.n * self.pixels, 25)
+        window.fill((255, 255, 255), rect)
+        if "status" not in _fonts:
+            _fonts["status"] = pygame.font.Font('freesansbold.ttf', 15)
+        window.blit(_fonts["status"].render(text, True, (0, 0, 0)), (0, rect.y))
+        return [rect]
+
+    def reset_cubes(self, window):
+        """Shows the values of the board on all the cubes (and removes the highlights)
+
+        :param window: The interface of pygame that we are working on
+        """
+        for row in self.cubes:
+            for cube in row:
+                cube.value = 0
+                cube.color = False
+                cube.delete_value(window)
+                if self.board[cube.row][cube.col] != 0:
+                    cube.set_value(self.board[cube.row][cube.col], False, window)
+                cube.is_unpress(window)
 
     def submit(self, window):
         """Checks if the sudoku can be solved with the given number , and if yes then puts it on the board.
 
-        If the algorithm isn't working, and the Cube is pressed , Cubes value isn't 0 and the entered number is legal
-        then we may enter the number to the board and update all the boards else delete the users number and
-        clear all the boards from it
+        If the algorithm isn't working, and the Cube is pressed , Cubes value isn't 0 and the oracle says the board can
+        still be solved with the entered number then we may enter the number to the board, else delete the users number.
+        The oracle searches the board once and answers from its cached solution after that
 
         :param window: The interface of pygame that we are working on
         """
-        self.update_tmp_board()
         if not self.auto:
-            for i in range(CUBE_NUMBER):
-                for j in range(CUBE_NUMBER):
+            for i in range(self.n):
+                for j in range(self.n):
                     if self.cubes[i][j].pressed and self.cubes[i][j].tmp_value != 0:
                         num = self.cubes[i][j].tmp_value
-                        if Solver.CheckIfLegal(self.tmp_board, i, j, self.cubes[i][j].tmp_value):
-                            self.tmp_board[i][j] = self.cubes[i][j].tmp_value
-                            if Solver.SudokuSolver(self.tmp_board):
-                                self.cubes[i][j].set_value(self.cubes[i][j].tmp_value, False,window)
-                                self.cubes[i][j].is_unpress(window)
-                                self.board[i][j] = num
-                            else:
-                                self.cubes[i][j].delete_value(window)
+                        if self.oracle.check(self.board, i, j, num):
+                            self.cubes[i][j].set_value(num, False, window)
+                            self.cubes[i][j].is_unpress(window)
+                            self.oracle.accept(self.board, i, j, num)
+                            self.board[i][j] = num
                         else:
                             self.cubes[i][j].delete_value(window)
 
@@ -170,6 +325,16 @@ class Cube:
     :type self.color: tuple(rgb)
     :atr self.tmp_value: the temporary index that the user has chose (starts with 0)
     :type self.tmp_value: int
+    :atr self.n: amount of cubes each side of the board (the biggest value)
+    :type self.n: int
+    :atr self.width: width of the cube in pixels
+    :type self.width: int
+    :atr self.height: height of the cube in pixels
+    :type self.height: int
+    :atr self.shown: the border that is drawn now (pressed , color) , None when it was cleared
+    :type self.shown: tuple (bool, bool)
+    :atr self.dirty: A flag that show if the cube was drawn since the window was last updated
+    :type self.dirty: bool
 
     :method __init__: Initiates the class
     :method update: Updates all the time the values depending on the status of the class (pressed or no / has tmp number
@@ -187,27 +352,34 @@ class Cube:
     :type col: int
     :param window:the surface of pygame that we draw on it
     :type window: pygame.display
+    :param n: amount of cubes each side of the board (default is 9)
+    :type n: int
+    :param pixels: width and height of the cube in pixels (default is CUBE_WIDTH)
+    :type pixels: int
     """
-    def __init__(self, value, row, col, window):
+    def __init__(self, value, row, col, window, n=9, pixels=CUBE_WIDTH):
         """Initiates the class"""
         self.value = value
         self.row = row
         self.col = col
+        self.n = n
+        self.width = pixels
+        self.height = pixels
         self.pressed = False
-        self.x = CUBE_WIDTH*self.col
-        self.y = CUBE_HEIGHT*self.row
+        self.x = self.width*self.col
+        self.y = self.height*self.row
         self.rect = None
         self.color = False
         self.tmp_value = 0
+        self.shown = (False, False)
+        self.dirty = True
 
         def draw():
             """draws the cube, the border (number if given)"""
             color = (0, 0, 0)
             if self.value != 0:
-                font = pygame.font.SysFont('gadugi', 25)
-                num_txt = font.render(str(self.value), True, (0, 0, 0))
-                window.blit(num_txt, (self.x + CUBE_WIDTH / 2 - 5, self.y + CUBE_HEIGHT / 2 - 17))
-            self.rect = pygame.draw.rect(window, color, pygame.Rect(self.x, self.y, CUBE_WIDTH, CUBE_HEIGHT), 1)
+                self.draw_number(self.value, False, window)
+            self.rect = pygame.draw.rect(window, color, pygame.Rect(self.x, self.y, self.width, self.height), 1)
 
         draw()
 
@@ -221,9 +393,11 @@ class Cube:
         """
         self.pressed = False
         color = (255, 255, 255)
-        pygame.draw.rect(window, color, pygame.Rect(self.x, self.y, CUBE_WIDTH, CUBE_HEIGHT), 2)
+        pygame.draw.rect(window, color, pygame.Rect(self.x, self.y, self.width, self.height), 2)
         color = (0, 0, 0)
-        pygame.draw.rect(window, color, pygame.Rect(self.x, self.y, CUBE_WIDTH, CUBE_HEIGHT), 1)
+        pygame.draw.rect(window, color, pygame.Rect(self.x, self.y, self.width, self.height), 1)
+        self.shown = (False, False)
+        self.dirty = True
 
     def is_pressed(self, window):
         """presses the button and if submits then highlights green , otherwise red
@@ -237,13 +411,15 @@ class Cube:
             self.is_unpress(window)
             self.pressed = True
             color = (255, 0, 0)
-        pygame.draw.rect(window, color, pygame.Rect(self.x, self.y, CUBE_WIDTH, CUBE_HEIGHT), 2)
+        pygame.draw.rect(window, color, pygame.Rect(self.x, self.y, self.width, self.height), 2)
+        self.shown = (True, bool(self.color))
+        self.dirty = True
 
     def update(self, pressed_keys, pressed_mouse, window):
         """Updates all the time the values depending on the status of the class (pressed or no / has tmp number
 
         changes value depending on the keyboard button clicked (1-9) , and change to status 'pressed' when button is
-        pressed with mouse
+        pressed with mouse. The border is drawn only when it is not the one that is already shown
 
         :param pressed_keys:the key that was pressed
         :type pressed_keys: the key
@@ -253,30 +429,18 @@ class Cube:
         :type window: pygame.display
         """
         if self.pressed:
-            self.is_pressed(window)
+            if self.shown != (True, bool(self.color)):
+                self.is_pressed(window)
             if self.value == 0:
-                if pressed_keys[pygame.K_1]:
-                    self.set_value(1, True, window)
-                elif pressed_keys[pygame.K_2]:
-                    self.set_value(2, True, window)
-                elif pressed_keys[pygame.K_3]:
-                    self.set_value(3, True, window)
-                elif pressed_keys[pygame.K_4]:
-                    self.set_value(4, True, window)
-                elif pressed_keys[pygame.K_5]:
-                    self.set_value(5, True, window)
-                elif pressed_keys[pygame.K_6]:
-                    self.set_value(6, True, window)
-                elif pressed_keys[pygame.K_7]:
-                    self.set_value(7, True, window)
-                elif pressed_keys[pygame.K_8]:
-                    self.set_value(8, True, window)
-                elif pressed_keys[pygame.K_9]:
-                    self.set_value(9, True, window)
-        else:
+                for num in range(1, self.n + 1):
+                    if pressed_keys[VALUE_KEYS[num - 1]]:
+                        if self.tmp_value != num:
+                            self.set_value(num, True, window)
+                        break
+        elif self.shown != (False, False):
             self.is_unpress(window)
         mouse_pos = pygame.mouse.get_pos()
-        if mouse_pos[1] < CUBE_NUMBER * CUBE_HEIGHT:
+        if mouse_pos[1] < self.n * self.height:
             if pressed_mouse[0]:
                 if self.rect.collidepoint(mouse_pos):
                     self.color = False
@@ -289,7 +453,9 @@ class Cube:
 
         :param window:the surface of pygame that we draw on it
         :type window: pygame.display"""
-        self.rect = pygame.draw.rect(window, (255, 255, 255), pygame.Rect(self.x, self.y, CUBE_WIDTH, CUBE_HEIGHT))
+        self.rect = pygame.draw.rect(window, (255, 255, 255), pygame.Rect(self.x, self.y, self.width, self.height))
+        self.shown = None
+        self.dirty = True
         if self.value == 0:
             self.tmp_value = 0
 
@@ -307,14 +473,26 @@ class Cube:
         self.delete_value(window)
         if tmp:
             self.tmp_value = value
-            font = pygame.font.SysFont('gadugi', 23)
-            num_txt = font.render(str(value), True, (192, 192, 192))
-            window.blit(num_txt, (self.x + CUBE_WIDTH / 2 - 20, self.y + CUBE_HEIGHT / 2 - 25))
         else:
             self.value = value
-            font = pygame.font.SysFont('gadugi', 25)
-            num_txt = font.render(str(value), True, (0, 0, 0))
-            window.blit(num_txt, (self.x + CUBE_WIDTH / 2 - 5, self.y + CUBE_HEIGHT / 2 - 17))
+        self.draw_number(value, tmp, window)
+
+    def draw_number(self, value, tmp, window):
+        """draws a number on the cube , a final one black in the middle and a tmp one small and grey in the corner
+
+        :param value: the number
+        :type value: int
+        :param tmp: if the number is the one given by the user
+        :type tmp: bool
+        :param window:the surface of pygame that we draw on it
+        :type window: pygame.display
+        """
+        num_txt = glyph(value, tmp, self.height)
+        if tmp:
+            window.blit(num_txt, (self.x + self.width // 10, self.y))
+        else:
+            window.blit(num_txt, num_txt.get_rect(center=(self.x + self.width // 2, self.y + self.height // 2)))
+        self.dirty = True
 
 
 def menu(board):
@@ -324,8 +502,11 @@ def menu(board):
     Then runs a while loop in which it sends all the time users activities and changes the status of the board
     accordingly .
     """
+    n = len(board)
+    side = cube_pixels(n) * n
     pygame.init()
-    window = pygame.display.set_mode((CUBE_WIDTH * CUBE_NUMBER, CUBE_HEIGHT * CUBE_NUMBER + 100))
+    # the instructions take 100 pixels under the board and the statistics of the algorithm another 30
+    window = pygame.display.set_mode((side, side + 130))
     pygame.display.set_caption('Sudoku Solver')
     window.fill((255, 255, 255))
 
@@ -333,30 +514,47 @@ def menu(board):
     font = pygame.font.Font('freesansbold.ttf', 25)
     text = "Wellcome to my game!!!"
     num_txt = font.render(text, True, (0, 0, 0))
-    window.blit(num_txt, (0, CUBE_NUMBER * CUBE_HEIGHT + 10))
+    window.blit(num_txt, (0, side + 10))
     font = pygame.font.Font('freesansbold.ttf', 15)
-    text = " c = clear place   enter = place number   1-9 = numbers"
+    if n <= 9:
+        text = " c = clear place   enter = place number   1-%d = numbers" % n
+    else:
+        text = " backspace = clear place   enter = place number   1-9 a-%s = numbers" % Solver.SYMBOLS[n].lower()
     num_txt = font.render(text, True, (0, 0, 0))
-    window.blit(num_txt, (0, CUBE_NUMBER * CUBE_HEIGHT + 40))
+    window.blit(num_txt, (0, side + 40))
     text = " lft mouse = pick a place   space = auto solve"
     num_txt = font.render(text, True, (0, 0, 0))
-    window.blit(num_txt, (0, CUBE_NUMBER * CUBE_HEIGHT + 60))
+    window.blit(num_txt, (0, side + 60))
+    text = " esc = stop solving   r = restart solving   +/- = solving speed"
+    num_txt = font.render(text, True, (0, 0, 0))
+    window.blit(num_txt, (0, side + 80))
 
     s = Sudoku(board, window)
+    pygame.display.flip()
+    clock = pygame.time.Clock()
 
     running = True
     while running:
-        pygame.time.delay(50)
+        clock.tick(FPS)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
             if event.type == pygame.KEYDOWN:
-                if not s.auto:
+                if event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                    s.change_speed(True)
+                if event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    s.change_speed(False)
+                if s.auto:
+                    if event.key == pygame.K_ESCAPE:
+                        s.cancel_solving(window)
+                    if event.key == pygame.K_r:
+                        s.restart_solving(window)
+                else:
                     if event.key == pygame.K_SPACE:
                         s.start_solving()
                     if event.key == pygame.K_RETURN:
                         s.submit(window)
-                    if event.key == pygame.K_c:
+                    if event.key in clear_keys(n):
                         s.clear_tmp(window)
 
         # if the algorithm is running then cant play
@@ -364,8 +562,9 @@ def menu(board):
             pressed_keys = pygame.key.get_pressed()
             pressed_mouse = pygame.mouse.get_pressed()
 
-        s.update(pressed_keys, pressed_mouse, window)
-        pygame.display.flip()
+        changed = s.update(pressed_keys, pressed_mouse, window) + s.draw_status(window)
+        if changed:
+            pygame.display.update(changed)
 
 
 # The given board (can be changed)
@@ -378,4 +577,6 @@ board = [[3, 0, 6, 5, 0, 8, 4, 0, 0],
           [1, 3, 0, 0, 0, 0, 2, 5, 0],
           [0, 0, 0, 0, 0, 0, 0, 7, 4],
           [0, 0, 5, 2, 0, 6, 3, 0, 0]]
-menu(board)
+
+if __name__ == "__main__":
+    menu(board)
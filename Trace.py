@@ -0,0 +1,123 @@
+"""A compact trace of the moves of the solver
+
+Every move (row, col, num and placed/removed) is packed into a single unsigned int of an array('I') instead of a
+Solver.Cube object, so a trace of millions of moves costs 4 bytes a move. Reading a move back gives a Solver.Cube,
+so the GUI replays it exactly like a list of moves.
+The trace can keep only the first moves (limit) or every k-th move (every) to bound its memory.
+
+The file contains the following functions and classes:
+    :class MoveTrace: the packed moves and a list-like view of them
+    :func Unpack: turns a packed move back into a Solver.Cube
+"""
+
+from array import array
+import Solver
+
+# bits of every field in the packed move (row, col and num up to 255)
+FIELD_BITS = 8
+FIELD_MASK = (1 << FIELD_BITS) - 1
+ROW_SHIFT = 2 * FIELD_BITS + 1
+COL_SHIFT = FIELD_BITS + 1
+
+
+class MoveTrace:
+    """A class that keeps the moves of the solver packed in an array
+
+    A move is packed as row << 17 | col << 9 | num << 1 | placed (8 bits for each of row, col and num).
+
+    :atr self.moves: the packed moves
+    :type self.moves: array ('I')
+    :atr self.limit: the biggest amount of moves kept (None for no limit)
+    :type self.limit: int
+    :atr self.every: keep one move of every 'every' moves
+    :type self.every: int
+    :atr self.seen: amount of moves that were recorded (including the ones that were not kept)
+    :type self.seen: int
+
+    :method __init__: Initiates the class
+    :method record: adds a move without creating an object for it
+    :method append: adds a move given as Solver.Cube (like list.append)
+    :method reverse: reverses the order of the moves (like list.reverse)
+    :method pop: removes and returns the last move as Solver.Cube (like list.pop)
+    :method dropped: amount of moves that were recorded but not kept
+
+    :param limit: the biggest amount of moves kept (default is None , no limit)
+    :type limit: int
+    :param every: keep one move of every 'every' moves (default is 1 , all of them)
+    :type every: int
+    """
+    def __init__(self, limit=None, every=1):
+        """Initiates the class"""
+        if every < 1:
+            raise ValueError("every must be at least 1 , got %d" % every)
+        self.moves = array('I')
+        self.limit = limit
+        self.every = every
+        self.seen = 0
+
+    def record(self, row, col, num, placed):
+        """adds a move without creating an object for it
+
+        :param row: row index
+        :type row: int
+        :param col: column index
+        :type col: int
+        :param num: the number
+        :type num: int
+        :param placed: true if the number was put , false if it was removed
+        :type placed: bool
+        """
+        self.seen += 1
+        if self.every != 1 and (self.seen - 1) % self.every:
+            return
+        if self.limit is not None and len(self.moves) >= self.limit:
+            return
+        self.moves.append(row << ROW_SHIFT | col << COL_SHIFT | num << 1 | placed)
+
+    def append(self, cube):
+        """adds a move given as Solver.Cube (like list.append)
+
+        :param cube: the move
+        :type cube: Solver.Cube
+        """
+        self.record(cube[0], cube[1], cube[2], cube[3])
+
+    def reverse(self):
+        """reverses the order of the moves (like list.reverse)"""
+        self.moves.reverse()
+
+    def pop(self):
+        """removes and returns the last move as Solver.Cube (like list.pop)
+
+        :return: the move
+        :rtype: Solver.Cube
+        """
+        return Unpack(self.moves.pop())
+
+    def dropped(self):
+        """amount of moves that were recorded but not kept
+
+        :rtype: int
+        """
+        return self.seen - len(self.moves)
+
+    def __len__(self):
+        return len(self.moves)
+
+    def __getitem__(self, index):
+        return Unpack(self.moves[index])
+
+    def __iter__(self):
+        return map(Unpack, self.moves)
+
+
+def Unpack(packed):
+    """turns a packed move back into a Solver.Cube
+
+    :param packed: the packed move
+    :type packed: int
+    :return: the move
+    :rtype: Solver.Cube
+    """
+    return Solver.Cube(packed >> ROW_SHIFT, packed >> COL_SHIFT & FIELD_MASK, packed >> 1 & FIELD_MASK,
+                       bool(packed & 1))
@@ -0,0 +1,140 @@
+"""Solves a batch of sudokus at once with vectorized constraint propagation
+
+All the puzzles are held as one (B, 81, 9) boolean candidates tensor (for 9x9 , (B, n*n, n) for any size), and
+elimination, naked singles and hidden singles are done for all of them together with NumPy operations.
+Only the puzzles that propagation alone doesn't finish are sent to the scalar backtracker in Solver.py.
+
+This script requires 'numpy' be installed within the Python environment.
+
+The file contains the following functions:
+    :func ToArray: puts puzzles (boards or lines) into a (B, 81) array
+    :func Propagate: propagates the candidates of all the puzzles until nothing changes
+    :func SolveAll: solves all the puzzles , propagation first and backtracking for the rest
+"""
+
+import math
+import numpy as np
+import Board
+import Solver
+
+SOLVED = 1
+OPEN = 0
+CONTRADICTION = -1
+
+
+def Units(n):
+    """returns the cubes of every row , column and box
+
+    :param n: amount of cubes in each side of the board
+    :type n: int
+    :return: array of (3*n, n) cube indices
+    :rtype: numpy.ndarray
+    """
+    size = Solver.BoxSize(n)
+    rows = [[row * n + col for col in range(n)] for row in range(n)]
+    cols = [[row * n + col for row in range(n)] for col in range(n)]
+    boxes = [[(box // size * size + i // size) * n + box % size * size + i % size for i in range(n)]
+             for box in range(n)]
+    return np.array(rows + cols + boxes, dtype=np.intp)
+
+
+def ToArray(puzzles):
+    """puts puzzles (boards or lines) into a (B, 81) array
+
+    All the puzzles must have the same size.
+
+    :param puzzles: boards (list (int*int) or Board.Board) or puzzle lines
+    :type puzzles: iterable
+    :return: the puzzles , one flat row each (0 in the empty places)
+    :rtype: numpy.ndarray (uint8)
+    """
+    rows = [Solver.LineToBoard(puzzle) if isinstance(puzzle, str) else puzzle for puzzle in puzzles]
+    n = len(rows[0]) if rows else Solver.N
+    grid = np.empty((len(rows), n * n), dtype=np.uint8)
+    for index, row in enumerate(rows):
+        # a Board.Board is already a flat uint8 buffer
+        grid[index] = np.frombuffer(row.cells, dtype=np.uint8) if isinstance(row, Board.Board) else \
+            np.asarray(row, dtype=np.uint8).reshape(n * n)
+    return grid
+
+
+def Propagate(grid):
+    """propagates the candidates of all the puzzles until nothing changes
+
+    Each round removes from every cube the numbers that are placed in its row, column and box, then places the
+    naked singles (a cube with one candidate) and the hidden singles (a number with one cube left in a unit).
+    A puzzle gets a contradiction when a cube or a number in a unit runs out of places.
+
+    :param grid: the puzzles , one flat row each (changed in place)
+    :type grid: numpy.ndarray (uint8)
+    :return: the candidates (B, 81, 9) and the status of every puzzle (SOLVED , OPEN or CONTRADICTION)
+    :rtype: tuple (numpy.ndarray, numpy.ndarray)
+    """
+    n = math.isqrt(grid.shape[1])
+    units = Units(n)
+    # the 3 units of every cube
+    cell_units = np.zeros((n * n, 3), dtype=np.intp)
+    for unit, cubes in enumerate(units):
+        cell_units[cubes, unit // n] = unit
+    digits = np.arange(1, n + 1, dtype=np.uint8)
+
+    status = np.full(len(grid), OPEN, dtype=np.int8)
+    candidates = np.ones(grid.shape + (n,), dtype=bool)
+    active = np.arange(len(grid))
+    while len(active):
+        board = grid[active]
+        placed = board[:, :, None] == digits
+        placed_units = placed[:, units, :]
+        duplicate = (placed_units.sum(axis=2) > 1).any(axis=(1, 2))
+        used = placed_units.any(axis=2)
+        cand = ~used[:, cell_units, :].any(axis=2)
+        cand[board != 0] = placed[board != 0]
+        count = cand.sum(axis=2)
+        in_unit = cand[:, units, :].sum(axis=2)
+        dead = duplicate | (count == 0).any(axis=1) | (in_unit == 0).any(axis=(1, 2))
+
+        changed = np.zeros(len(active), dtype=bool)
+        # naked singles
+        naked = (board == 0) & (count == 1)
+        b, cube = np.nonzero(naked)
+        board[b, cube] = cand[b, cube].argmax(axis=1) + 1
+        changed[b] = True
+        # hidden singles
+        hidden = cand[:, units, :] & ((in_unit == 1) & ~used)[:, :, None, :]
+        b, unit, i, digit = np.nonzero(hidden)
+        cube = units[unit, i]
+        free = board[b, cube] == 0
+        board[b[free], cube[free]] = digit[free] + 1
+        changed[b[free]] = True
+
+        changed &= ~dead
+        grid[active] = board
+        candidates[active] = cand
+        status[active[dead]] = CONTRADICTION
+        finished = ~dead & ~changed
+        status[active[finished & (board != 0).all(axis=1)]] = SOLVED
+        active = active[changed]
+    return candidates, status
+
+
+def SolveAll(puzzles, backend="bitmask"):
+    """solves all the puzzles , propagation first and backtracking for the rest
+
+    :param puzzles: boards (list (int*int)) , puzzle lines or a (B, 81) array
+    :type puzzles: iterable
+    :param backend: the name of the backtracking algorithm for the puzzles propagation didn't finish
+     (see Solver.SudokuSolver)
+    :type backend: str
+    :return: the solutions (the rows of the unsolved puzzles are left as far as they got) and which were solved
+    :rtype: tuple (numpy.ndarray (uint8), numpy.ndarray (bool))
+    """
+    grid = np.array(puzzles, dtype=np.uint8) if isinstance(puzzles, np.ndarray) else ToArray(puzzles)
+    _, status = Propagate(grid)
+    solved = status == SOLVED
+    n = math.isqrt(grid.shape[1])
+    for index in np.nonzero(status == OPEN)[0]:
+        sudoku = grid[index].reshape(n, n).tolist()
+        if Solver.SudokuSolver(sudoku, backend=backend):
+            grid[index] = np.array(sudoku, dtype=np.uint8).ravel()
+            solved[index] = True
+    return grid, solved
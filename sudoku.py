@@ -0,0 +1,189 @@
+"""The command line entry point , it solves puzzle files without a display (pygame is only imported by the gui command)
+
+The puzzles are one line each (see Solver.LineToBoard) , read as a stream from stdin or from files (memory mapped, so
+a file of millions of puzzles is never read into memory at once). Blank lines and '#' comments are skipped.
+Every puzzle gets one output line , in the order of the input unless --unordered: its solution , "none" when it has no
+solution or "error" when it could not be read or ran out of budget (the message goes to stderr).
+
+Usage:
+    python -m sudoku solve puzzles.txt --backend dlx --processes 4 > solutions.txt
+    cat puzzles.txt | python -m sudoku solve --stats --timeout 1
+    python -m sudoku gui 003020600900305001001806400008102900700000008006708200002609500800203009005010300
+    python -m sudoku serve --port 8765 --processes 4            (see Server.py)
+
+The file contains the following functions:
+    :func ReadPuzzles: a generator of the puzzle lines of stdin or files
+    :func Solve: solves the puzzles and writes the results
+    :func Gui: opens a puzzle in the GUI
+    :func Serve: runs the solving server until it is stopped
+    :func main: the command line entry point
+"""
+
+import argparse
+import json
+import mmap
+import sys
+import time
+import Batch
+import Solver
+
+
+def ReadPuzzles(paths, stdin=None):
+    """a generator of the puzzle lines of stdin or files
+
+    :param paths: the files to read , "-" reads stdin (none reads stdin)
+    :type paths: list (str)
+    :param stdin: the stream read for "-" (default is sys.stdin)
+    :type stdin: io.TextIOBase
+    :return: generator of puzzle lines
+    """
+    for path in paths or ["-"]:
+        if path == "-":
+            lines = (line.strip() for line in (stdin or sys.stdin))
+            yield from (line for line in lines if line and not line.startswith("#"))
+            continue
+        with open(path, "rb") as puzzles:
+            # an empty file can't be mapped
+            if not puzzles.seek(0, 2):
+                continue
+            with mmap.mmap(puzzles.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for raw in iter(mapped.readline, b""):
+                    line = raw.strip()
+                    if line and not line.startswith(b"#"):
+                        yield line.decode("ascii")
+
+
+def Solve(args, output=None, errors=None):
+    """solves the puzzles and writes the results
+
+    :param args: the parsed arguments of the solve command
+    :type args: argparse.Namespace
+    :param output: where the results are written (default is sys.stdout)
+    :type output: io.TextIOBase
+    :param errors: where the error messages and statistics are written (default is sys.stderr)
+    :type errors: io.TextIOBase
+    :return: the exit code , 1 when a puzzle had an error
+    :rtype: int
+    """
+    output = output or sys.stdout
+    errors = errors or sys.stderr
+    totals = {"puzzles": 0, "solved": 0, "none": 0, "errors": 0, "nodes": 0, "backtracks": 0}
+    start = time.perf_counter()
+    results = Batch.SolveBatch(ReadPuzzles(args.files), args.processes, args.chunksize, not args.unordered,
+                               args.backend, args.stats, args.max_nodes, args.timeout)
+    for result in results:
+        totals["puzzles"] += 1
+        if result.error is not None:
+            totals["errors"] += 1
+            output.write("error\n")
+            errors.write("puzzle %d: %s\n" % (result.index, result.error))
+        elif result.solution is None:
+            totals["none"] += 1
+            output.write("none\n")
+        else:
+            totals["solved"] += 1
+            output.write(result.solution + "\n")
+        if result.stats is not None:
+            totals["nodes"] += result.stats["nodes"]
+            totals["backtracks"] += result.stats["backtracks"]
+            errors.write(json.dumps(dict(result.stats, index=result.index)) + "\n")
+        if totals["puzzles"] % args.chunksize == 0:
+            output.flush()
+    output.flush()
+    if args.stats:
+        totals["seconds"] = time.perf_counter() - start
+        totals["puzzles_per_second"] = totals["puzzles"] / totals["seconds"] if totals["seconds"] else 0.0
+        errors.write(json.dumps(totals) + "\n")
+    return 1 if totals["errors"] else 0
+
+
+def Gui(args):
+    """opens a puzzle in the GUI (the board of SudokuGUI.py when no puzzle is given)
+
+    :param args: the parsed arguments of the gui command
+    :type args: argparse.Namespace
+    :return: the exit code
+    :rtype: int
+    """
+    import SudokuGUI
+    SudokuGUI.menu(Solver.LineToBoard(args.puzzle) if args.puzzle else SudokuGUI.board)
+    return 0
+
+
+def Serve(args):
+    """runs the solving server until it is stopped (Ctrl+C)
+
+    :param args: the parsed arguments of the serve command
+    :type args: argparse.Namespace
+    :return: the exit code
+    :rtype: int
+    """
+    import asyncio
+    import Server
+
+    async def run():
+        """starts the server and serves forever"""
+        server = Server.SolvingServer(args.processes, args.backend, args.batch_size, args.batch_delay,
+                                      args.max_pending, args.timeout)
+        address = await server.start(args.host, args.port, args.unix)
+        print("serving on %s" % (address,), file=sys.stderr)
+        try:
+            await server.server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def main(argv=None):
+    """the command line entry point
+
+    :param argv: the arguments (default is sys.argv[1:])
+    :type argv: list (str)
+    :return: the exit code
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(prog="python -m sudoku", description="Sudoku solver")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solve = commands.add_parser("solve", help="solve puzzle lines from files or stdin , one result line each")
+    solve.add_argument("files", nargs="*", help="puzzle files , '-' or nothing reads stdin")
+    solve.add_argument("--backend", default="bitmask", choices=("bitmask", "dlx"))
+    solve.add_argument("--processes", "-j", type=int, default=1,
+                       help="worker processes , 0 uses all the cpus (default is 1 , solve in this process)")
+    solve.add_argument("--chunksize", type=int, default=64, help="puzzles sent to a worker at once")
+    solve.add_argument("--unordered", action="store_true", help="write the results as soon as they are solved")
+    solve.add_argument("--stats", action="store_true",
+                       help="write the counters of every puzzle and a summary as JSON lines to stderr")
+    solve.add_argument("--max-nodes", type=int, default=None, help="give up a puzzle after this amount of nodes")
+    solve.add_argument("--timeout", type=float, default=None, help="give up a puzzle after this amount of seconds")
+    solve.set_defaults(run=Solve)
+
+    gui = commands.add_parser("gui", help="open a puzzle in the GUI (needs pygame and a display)")
+    gui.add_argument("puzzle", nargs="?", help="a puzzle line (default is the board of SudokuGUI.py)")
+    gui.set_defaults(run=Gui)
+
+    serve = commands.add_parser("serve", help="serve puzzles over a TCP or Unix socket , one line each")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--unix", default=None, help="listen on this Unix socket instead of TCP")
+    serve.add_argument("--backend", default="bitmask", choices=("bitmask", "dlx"))
+    serve.add_argument("--processes", "-j", type=int, default=0, help="worker processes (default is all the cpus)")
+    serve.add_argument("--batch-size", type=int, default=64, help="the most puzzles in a batch")
+    serve.add_argument("--batch-delay", type=float, default=0.002, help="seconds a batch waits for more puzzles")
+    serve.add_argument("--max-pending", type=int, default=1024, help="requests waiting before clients are slowed")
+    serve.add_argument("--timeout", type=float, default=10.0, help="seconds until a request is answered timeout")
+    serve.set_defaults(run=Serve)
+
+    args = parser.parse_args(argv)
+    if getattr(args, "processes", 1) == 0:
+        args.processes = None
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
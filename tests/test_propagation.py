@@ -0,0 +1,77 @@
+"""Regression tests of the contradiction path of the propagation stages"""
+
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Propagation
+import Solver
+import Trace
+
+EASY = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+
+
+def DeadBoard():
+    """two cubes of the first row are left with the same single candidate (5)"""
+    board = [[1, 2, 3, 4, 0, 0, 7, 8, 9]] + [[0] * 9 for _ in range(8)]
+    board[1][4] = 6
+    board[3][5] = 6
+    return board
+
+
+def WrongDigitBoards():
+    """the easy puzzle with one wrong number put in an empty cube where it breaks no rule"""
+    solution = Solver.LineToBoard(EASY)
+    assert Solver.SudokuSolver(solution)
+    puzzle = Solver.LineToBoard(EASY)
+    for row in range(9):
+        for col in range(9):
+            if puzzle[row][col]:
+                continue
+            for num in range(1, 10):
+                if num != solution[row][col] and Solver.CheckIfLegal(puzzle, row, col, num):
+                    board = Solver.CopyBoard(puzzle)
+                    board[row][col] = num
+                    yield board
+
+
+def test_place_reports_peer_without_candidates():
+    prop, possible = Propagation.Reduce(DeadBoard(), ["naked_singles"])
+    assert not possible
+
+
+def test_undo_empties_the_cube_of_the_contradiction():
+    board = DeadBoard()
+    prop, possible = Propagation.Reduce(board, ["naked_singles"])
+    assert not possible
+    prop.undo()
+    assert board == DeadBoard()
+
+
+@pytest.mark.parametrize("backend, stages", [
+    ("bitmask", ["naked_singles"]),
+    ("bitmask", ["naked_singles", "hidden_singles"]),
+    ("bitmask", list(Propagation.STAGES)),
+    ("dlx", list(Propagation.STAGES)),
+])
+def test_unsolvable_leaves_the_board_as_it_was(backend, stages):
+    for board in WrongDigitBoards():
+        puzzle = Solver.CopyBoard(board)
+        moves = Trace.MoveTrace()
+        if not Solver.SudokuSolver(board, moves, backend, stages):
+            assert board == puzzle
+            # every number the moves put is taken back as well
+            replay = Solver.CopyBoard(puzzle)
+            for move in moves:
+                replay[move.row][move.col] = move.num if move.color else 0
+            assert replay == puzzle
+
+
+def test_budget_unsolvable_leaves_the_board_as_it_was():
+    for board in WrongDigitBoards():
+        puzzle = Solver.CopyBoard(board)
+        status, _ = Solver.SolveWithBudget(board, stages=list(Propagation.STAGES))
+        if status == Solver.UNSOLVABLE:
+            assert board == puzzle